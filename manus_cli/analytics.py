@@ -3,110 +3,458 @@ Analytics and Metrics
 Track spec-driven development metrics and progress
 """
 
-import json
+import atexit
+import heapq
+import threading
+import time
+from collections import deque
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
 
-console = Console()
+from . import fastjson
+from .fileutils import atomic_write, tail_lines
+
+
+def _to_datetime(timestamp) -> datetime:
+    """Convert a stored timestamp (int nanoseconds or legacy ISO string)"""
+    if isinstance(timestamp, str):
+        return datetime.fromisoformat(timestamp)
+    return datetime.fromtimestamp(timestamp / 1e9)
+
+
+def _to_ns(timestamp) -> int:
+    """Sort key for stored timestamps of either format"""
+    if isinstance(timestamp, str):
+        return int(datetime.fromisoformat(timestamp).timestamp() * 1e9)
+    return timestamp
+
+
+# One background flusher and one exit hook serve every Analytics instance
+# with an open event log; both are started with the first recorded event
+_open_instances = set()
+_open_lock = threading.Lock()
+_flusher: Optional[threading.Thread] = None
+
+
+def _register(analytics: "Analytics"):
+    """Have the shared flusher and exit hook cover an instance"""
+    global _flusher
+    with _open_lock:
+        _open_instances.add(analytics)
+        if _flusher is None:
+            _flusher = threading.Thread(target=_flush_loop, daemon=True)
+            _flusher.start()
+            atexit.register(_close_all)
+
+
+def _unregister(analytics: "Analytics"):
+    with _open_lock:
+        _open_instances.discard(analytics)
+
+
+def _flush_loop():
+    """Background flusher so buffered events never wait long"""
+    while True:
+        time.sleep(Analytics.FLUSH_INTERVAL)
+        with _open_lock:
+            instances = list(_open_instances)
+        for analytics in instances:
+            analytics._maybe_flush()
+
+
+def _close_all():
+    with _open_lock:
+        instances = list(_open_instances)
+    for analytics in instances:
+        analytics.close()
 
 
 class Analytics:
     """Analytics for spec-driven development"""
     
+    # Compact the event log into the snapshot once it grows past this size
+    COMPACT_THRESHOLD = 1024 * 1024
+    
+    # Only the most recent timeline events are kept
+    TIMELINE_MAX = 1000
+    
+    # Buffered events are written once either limit is reached
+    FLUSH_EVENTS = 64
+    FLUSH_INTERVAL = 1.0
+    
     def __init__(self, manus_dir: Path):
         self.manus_dir = manus_dir
         self.analytics_file = manus_dir / "analytics.json"
+        self.timeline_file = manus_dir / "timeline.jsonl"
+        self.quality_scores_file = manus_dir / "quality_scores.jsonl"
+        self._events_log = manus_dir / "analytics.events.jsonl"
         self.load_analytics()
+        
+        # Opened with the first recorded event, and again after close()
+        self._events = None
+        self._pending: List[bytes] = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.RLock()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def load_analytics(self):
-        """Load analytics data"""
+        """
+        Load the analytics snapshot and replay the event log on top of it
+        
+        Only projects and counters are read here. The timeline and quality
+        score history live in their own JSONL files and are parsed lazily.
+        """
         if self.analytics_file.exists():
-            self.data = json.loads(self.analytics_file.read_text())
+            self.data = fastjson.loads(self.analytics_file.read_bytes())
         else:
             self.data = {
                 "projects": {},
                 "total_specs": 0,
                 "total_tasks": 0,
-                "completed_tasks": 0,
-                "quality_scores": [],
-                "timeline": []
+                "completed_tasks": 0
             }
+        self.data.setdefault("event_seq", 0)
+        
+        # Records not yet appended to timeline.jsonl / quality_scores.jsonl
+        self._timeline_tail: List[Dict] = []
+        self._quality_tail: List[Dict] = []
+        
+        # Snapshots from before the split carried both histories inline
+        if "timeline" in self.data or "quality_scores" in self.data:
+            self._migrate_inline_history()
+        
+        self.data.setdefault("quality_sum", 0)
+        self.data.setdefault("quality_count", 0)
+        # The quality aggregates cover each project's latest score; older
+        # snapshots summed every score and are recomputed once
+        if any("quality_scored" not in p for p in self.data["projects"].values()):
+            self._rebuild_quality()
+        self.data.setdefault("timeline_total_count", 0)
+        # Lines in timeline.jsonl; the total is an upper bound for older data
+        self.data.setdefault("timeline_stored", self.data["timeline_total_count"])
+        
+        self.__dict__.pop("timeline", None)
+        self.__dict__.pop("quality_scores", None)
+        
+        if self._events_log.exists():
+            with open(self._events_log, "rb") as f:
+                for line in f:
+                    try:
+                        event = fastjson.loads(line)
+                    except fastjson.JSONDecodeError:
+                        # Torn write at the tail of the log
+                        break
+                    # Skip events already folded into the snapshot
+                    if event["seq"] > self.data["event_seq"]:
+                        self._apply(event)
     
-    def save_analytics(self):
-        """Save analytics data"""
-        self.analytics_file.write_text(json.dumps(self.data, indent=2))
+    def _migrate_inline_history(self):
+        """Move inline timeline/quality_scores arrays into their JSONL files"""
+        timeline = self.data.pop("timeline", [])
+        scores = self.data.pop("quality_scores", [])
+        
+        self.data.setdefault("timeline_total_count", len(timeline))
+        
+        self._append_jsonl(self.timeline_file, timeline)
+        self._append_jsonl(self.quality_scores_file, scores)
+        atomic_write(self.analytics_file, fastjson.dumps(self.data, indent=True))
     
-    def track_project(self, project_name: str, spec_dir: Path):
-        """Track a new project"""
-        project_data = {
-            "name": project_name,
-            "created": datetime.now().isoformat(),
-            "spec_dir": str(spec_dir),
-            "phases_completed": [],
-            "quality_score": 0,
-            "tasks_total": 0,
-            "tasks_completed": 0
+    def _rebuild_quality(self):
+        """Recompute the quality aggregates from the stored score history"""
+        scored = {
+            record["project"] for record in self._read_jsonl(self.quality_scores_file, [])
+            if record.get("seq", 0) <= self.data["event_seq"]
         }
+        self.data["quality_sum"] = 0
+        self.data["quality_count"] = 0
+        for name, project in self.data["projects"].items():
+            project["quality_scored"] = name in scored
+            if project["quality_scored"]:
+                self.data["quality_sum"] += project["quality_score"]
+                self.data["quality_count"] += 1
+    
+    @staticmethod
+    def _append_jsonl(path: Path, records: List[Dict]):
+        """Append records to a JSONL file with a single write"""
+        if records:
+            with open(path, "ab") as f:
+                f.write(b"".join(fastjson.dumps(r) + b"\n" for r in records))
+    
+    def _append_history(self, path: Path, records: List[Dict]) -> int:
+        """
+        Append records newer than the last one stored and return how many
         
-        self.data["projects"][project_name] = project_data
-        self.data["total_specs"] += 1
+        Events replayed after a crash between appending and writing the
+        snapshot would otherwise be stored twice.
+        """
+        last = tail_lines(path, 1)
+        last_seq = fastjson.loads(last[0]).get("seq", 0) if last else 0
+        records = [r for r in records if r["seq"] > last_seq]
+        self._append_jsonl(path, records)
+        return len(records)
+    
+    def _trim_timeline(self):
+        """Rewrite timeline.jsonl with only the records that are ever read"""
+        lines = tail_lines(self.timeline_file, self.TIMELINE_MAX)
+        atomic_write(self.timeline_file, b"".join(line + b"\n" for line in lines))
+        self.data["timeline_stored"] = len(lines)
+    
+    @staticmethod
+    def _merge(stored: List[Dict], tail: List[Dict]) -> List[Dict]:
+        """Combine persisted records with unflushed ones, dropping duplicates"""
+        last_seq = stored[-1].get("seq", 0) if stored else 0
+        return stored + [r for r in tail if r["seq"] > last_seq]
+    
+    def _read_jsonl(self, path: Path, tail: List[Dict]) -> List[Dict]:
+        """Parse a whole JSONL history plus its unflushed tail"""
+        stored = []
+        if path.exists():
+            with open(path, "rb") as f:
+                stored = [fastjson.loads(line) for line in f if line.strip()]
+        return self._merge(stored, tail)
+    
+    def _read_recent(self, path: Path, tail: List[Dict], count: int) -> List[Dict]:
+        """Parse only the last `count` records of a JSONL history"""
+        stored = [fastjson.loads(line) for line in tail_lines(path, count)]
+        return self._merge(stored, tail)[-count:]
+    
+    @cached_property
+    def timeline(self) -> deque:
+        """Activity timeline, loaded on first access"""
+        return deque(
+            self._read_recent(self.timeline_file, self._timeline_tail, self.TIMELINE_MAX),
+            maxlen=self.TIMELINE_MAX
+        )
+    
+    @cached_property
+    def quality_scores(self) -> List[Dict]:
+        """Quality score history, loaded on first access"""
+        return self._read_jsonl(self.quality_scores_file, self._quality_tail)
+    
+    def recent_timeline(self, count: int) -> List[Dict]:
+        """Last `count` timeline events, oldest first, without a full parse"""
+        if "timeline" in self.__dict__:
+            return list(self.timeline)[-count:]
+        return self._read_recent(self.timeline_file, self._timeline_tail, count)
+    
+    def recent_quality_scores(self, count: int) -> List[Dict]:
+        """Last `count` quality scores, oldest first, without a full parse"""
+        if "quality_scores" in self.__dict__:
+            return self.quality_scores[-count:]
+        return self._read_recent(self.quality_scores_file, self._quality_tail, count)
+    
+    def save_analytics(self):
+        """Save analytics snapshot and truncate the event log"""
+        with self._lock:
+            # Histories are append-only, so only the unflushed tails are written
+            self.data["timeline_stored"] += self._append_history(self.timeline_file, self._timeline_tail)
+            self._append_history(self.quality_scores_file, self._quality_tail)
+            self._timeline_tail.clear()
+            self._quality_tail.clear()
+            
+            # Only the last TIMELINE_MAX records are kept; trimming at twice
+            # that keeps rewrites rare
+            if self.data["timeline_stored"] > 2 * self.TIMELINE_MAX:
+                self._trim_timeline()
+            
+            atomic_write(self.analytics_file, fastjson.dumps(self.data, indent=True))
+            # Buffered events are already part of the snapshot
+            self._pending.clear()
+            if self._events is not None:
+                self._events.seek(0)
+                self._events.truncate()
+            elif self._events_log.exists():
+                self._events_log.write_bytes(b"")
+    
+    def close(self):
+        """
+        Flush buffered events and close the event log
         
-        self.data["timeline"].append({
-            "timestamp": datetime.now().isoformat(),
-            "event": "project_created",
-            "project": project_name
-        })
+        Events tracked afterwards reopen the log, so close() is safe to call
+        at any point, and more than once.
+        """
+        with self._lock:
+            self._flush()
+            if self._events is not None:
+                self._events.close()
+                self._events = None
+        _unregister(self)
+    
+    def _record(self, event: Dict):
+        """Apply an event to the in-memory view and buffer it for the log"""
+        with self._lock:
+            if self._events is None:
+                self._events = open(self._events_log, "ab")
+                _register(self)
+            event["seq"] = self.data["event_seq"] + 1
+            self._apply(event)
+            self._pending.append(fastjson.dumps(event) + b"\n")
         
+        self._maybe_flush()
+    
+    def _maybe_flush(self):
+        """Flush when enough events are buffered or enough time has passed"""
+        if (len(self._pending) >= self.FLUSH_EVENTS or
+                time.monotonic() - self._last_flush > self.FLUSH_INTERVAL):
+            self._flush()
+    
+    def _flush(self):
+        """Write all buffered events to the log in one call"""
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if not self._pending or self._events is None:
+                return
+            
+            self._events.write(b"".join(self._pending))
+            self._events.flush()
+            self._pending.clear()
+            
+            if self._events.tell() > self.COMPACT_THRESHOLD:
+                self._compact()
+    
+    def _compact(self):
+        """Fold the event log into the analytics snapshot"""
         self.save_analytics()
     
+    def _apply(self, event: Dict):
+        """Apply a single event to self.data"""
+        self.data["event_seq"] = event["seq"]
+        kind = event["type"]
+        
+        if kind == "project":
+            project_name = event["project"]
+            self.data["projects"][project_name] = {
+                "name": project_name,
+                "created": event["timestamp"],
+                "spec_dir": event["spec_dir"],
+                "phases_completed": [],
+                "quality_score": 0,
+                "quality_scored": False,
+                "tasks_total": 0,
+                "tasks_completed": 0
+            }
+            self.data["total_specs"] += 1
+            
+            self._add_timeline({
+                "seq": event["seq"],
+                "timestamp": event["timestamp"],
+                "event": "project_created",
+                "project": project_name
+            })
+        
+        elif kind == "phase":
+            project = self.data["projects"][event["project"]]
+            project["phases_completed"].append(event["phase"])
+            
+            self._add_timeline({
+                "seq": event["seq"],
+                "timestamp": event["timestamp"],
+                "event": "phase_completed",
+                "project": event["project"],
+                "phase": event["phase"]
+            })
+        
+        elif kind == "quality":
+            project = self.data["projects"][event["project"]]
+            # A new score replaces the project's previous one in the average
+            if project["quality_scored"]:
+                self.data["quality_sum"] -= project["quality_score"]
+            else:
+                project["quality_scored"] = True
+                self.data["quality_count"] += 1
+            project["quality_score"] = event["score"]
+            self.data["quality_sum"] += event["score"]
+            record = {
+                "seq": event["seq"],
+                "project": event["project"],
+                "score": event["score"],
+                "timestamp": event["timestamp"]
+            }
+            self._quality_tail.append(record)
+            if "quality_scores" in self.__dict__:
+                self.quality_scores.append(record)
+        
+        elif kind == "tasks":
+            project = self.data["projects"][event["project"]]
+            old_total = project["tasks_total"]
+            old_completed = project["tasks_completed"]
+            
+            project["tasks_total"] = event["total"]
+            project["tasks_completed"] = event["completed"]
+            
+            self.data["total_tasks"] += (event["total"] - old_total)
+            self.data["completed_tasks"] += (event["completed"] - old_completed)
+    
+    def _add_timeline(self, record: Dict):
+        """Append a timeline record to the unflushed tail and loaded view"""
+        self._timeline_tail.append(record)
+        if "timeline" in self.__dict__:
+            self.timeline.append(record)
+        self.data["timeline_total_count"] += 1
+    
+    def track_project(self, project_name: str, spec_dir: Path):
+        """Track a new project"""
+        self._record({
+            "type": "project",
+            "project": project_name,
+            "spec_dir": str(spec_dir),
+            "timestamp": time.time_ns()
+        })
+    
     def track_phase_completion(self, project_name: str, phase: str):
         """Track phase completion"""
         if project_name in self.data["projects"]:
             project = self.data["projects"][project_name]
             if phase not in project["phases_completed"]:
-                project["phases_completed"].append(phase)
-                
-                self.data["timeline"].append({
-                    "timestamp": datetime.now().isoformat(),
-                    "event": "phase_completed",
+                self._record({
+                    "type": "phase",
                     "project": project_name,
-                    "phase": phase
+                    "phase": phase,
+                    "timestamp": time.time_ns()
                 })
-                
-                self.save_analytics()
     
     def track_quality_score(self, project_name: str, score: float):
         """Track quality score"""
         if project_name in self.data["projects"]:
-            self.data["projects"][project_name]["quality_score"] = score
-            self.data["quality_scores"].append({
+            self._record({
+                "type": "quality",
                 "project": project_name,
                 "score": score,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": time.time_ns()
             })
-            self.save_analytics()
     
     def track_tasks(self, project_name: str, total: int, completed: int):
         """Track task progress"""
         if project_name in self.data["projects"]:
-            project = self.data["projects"][project_name]
-            old_total = project["tasks_total"]
-            old_completed = project["tasks_completed"]
-            
-            project["tasks_total"] = total
-            project["tasks_completed"] = completed
-            
-            self.data["total_tasks"] += (total - old_total)
-            self.data["completed_tasks"] += (completed - old_completed)
-            
-            self.save_analytics()
+            self._record({
+                "type": "tasks",
+                "project": project_name,
+                "total": total,
+                "completed": completed
+            })
+    
+    def average_quality(self) -> float:
+        """Average of each project's latest quality score"""
+        if not self.data["quality_count"]:
+            return 0
+        return self.data["quality_sum"] / self.data["quality_count"]
     
     def display_dashboard(self):
         """Display analytics dashboard"""
+        # Rich is only needed here, so keep it off the import path
+        from rich.console import Console
+        from rich.table import Table
+        from rich.panel import Panel
+        
+        console = Console()
+        
         console.print(Panel(
             "[bold cyan]Analytics Dashboard[/bold cyan]\n"
             "Spec-Driven Development Metrics",
@@ -128,9 +476,7 @@ class Analytics:
             completion_rate = (self.data["completed_tasks"] / self.data["total_tasks"]) * 100
         stats_table.add_row("Completion Rate", f"{completion_rate:.1f}%")
         
-        avg_quality = 0
-        if self.data["quality_scores"]:
-            avg_quality = sum(s["score"] for s in self.data["quality_scores"]) / len(self.data["quality_scores"])
+        avg_quality = self.average_quality()
         stats_table.add_row("Avg Quality Score", f"{avg_quality:.1f}%")
         
         console.print(stats_table)
@@ -143,11 +489,11 @@ class Analytics:
         projects_table.add_column("Quality", style="green")
         projects_table.add_column("Tasks", style="blue")
         
-        recent_projects = sorted(
+        recent_projects = heapq.nlargest(
+            5,
             self.data["projects"].items(),
-            key=lambda x: x[1].get("created", ""),
-            reverse=True
-        )[:5]
+            key=lambda x: _to_ns(x[1].get("created", 0))
+        )
         
         for name, project in recent_projects:
             phases = len(project.get("phases_completed", []))
@@ -160,10 +506,10 @@ class Analytics:
         
         # Timeline
         console.print("\n[bold]Recent Activity[/bold]")
-        recent_events = self.data["timeline"][-10:]
+        recent_events = self.recent_timeline(10)
         
         for event in reversed(recent_events):
-            timestamp = datetime.fromisoformat(event["timestamp"])
+            timestamp = _to_datetime(event["timestamp"])
             time_str = timestamp.strftime("%Y-%m-%d %H:%M")
             event_type = event["event"].replace("_", " ").title()
             project = event.get("project", "")
@@ -176,43 +522,46 @@ class Analytics:
     
     def generate_report(self) -> str:
         """Generate analytics report"""
-        report = "# Spec-Driven Development Analytics Report\n\n"
-        report += f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        parts = []
+        w = parts.append
+        generated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
-        # Overall metrics
-        report += "## Overall Metrics\n\n"
-        report += f"- **Total Projects**: {self.data['total_specs']}\n"
-        report += f"- **Total Tasks**: {self.data['total_tasks']}\n"
-        report += f"- **Completed Tasks**: {self.data['completed_tasks']}\n"
+        w("# Spec-Driven Development Analytics Report\n\n")
+        w(f"**Generated**: {generated}\n\n")
         
+        # Overall metrics
         completion_rate = 0
         if self.data["total_tasks"] > 0:
             completion_rate = (self.data["completed_tasks"] / self.data["total_tasks"]) * 100
-        report += f"- **Completion Rate**: {completion_rate:.1f}%\n"
+        avg_quality = self.average_quality()
         
-        avg_quality = 0
-        if self.data["quality_scores"]:
-            avg_quality = sum(s["score"] for s in self.data["quality_scores"]) / len(self.data["quality_scores"])
-        report += f"- **Average Quality Score**: {avg_quality:.1f}%\n\n"
+        w("## Overall Metrics\n\n"
+          f"- **Total Projects**: {self.data['total_specs']}\n"
+          f"- **Total Tasks**: {self.data['total_tasks']}\n"
+          f"- **Completed Tasks**: {self.data['completed_tasks']}\n"
+          f"- **Completion Rate**: {completion_rate:.1f}%\n"
+          f"- **Average Quality Score**: {avg_quality:.1f}%\n\n")
         
         # Project details
-        report += "## Projects\n\n"
+        w("## Projects\n\n")
         
         for name, project in self.data["projects"].items():
-            report += f"### {name}\n\n"
-            report += f"- **Created**: {project.get('created', 'Unknown')}\n"
-            report += f"- **Phases Completed**: {len(project.get('phases_completed', []))}/6\n"
-            report += f"- **Quality Score**: {project.get('quality_score', 0):.1f}%\n"
-            report += f"- **Tasks**: {project.get('tasks_completed', 0)}/{project.get('tasks_total', 0)}\n\n"
+            created = project.get("created")
+            created = _to_datetime(created).isoformat() if created else "Unknown"
+            w(f"### {name}\n\n"
+              f"- **Created**: {created}\n"
+              f"- **Phases Completed**: {len(project.get('phases_completed', []))}/6\n"
+              f"- **Quality Score**: {project.get('quality_score', 0):.1f}%\n"
+              f"- **Tasks**: {project.get('tasks_completed', 0)}/{project.get('tasks_total', 0)}\n\n")
         
         # Trends
-        report += "## Trends\n\n"
+        w("## Trends\n\n")
         
-        if len(self.data["quality_scores"]) >= 2:
-            recent_scores = [s["score"] for s in self.data["quality_scores"][-5:]]
+        recent_scores = [s["score"] for s in self.recent_quality_scores(5)]
+        if len(recent_scores) >= 2:
             trend = "improving" if recent_scores[-1] > recent_scores[0] else "declining"
-            report += f"- Quality trend: {trend}\n"
+            w(f"- Quality trend: {trend}\n")
         
-        report += f"- Total activity events: {len(self.data['timeline'])}\n"
+        w(f"- Total activity events: {self.data['timeline_total_count']}\n")
         
-        return report
+        return "".join(parts)
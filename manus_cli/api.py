@@ -5,6 +5,7 @@ Manus API client for interacting with Manus AI services
 import os
 import json
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional, Dict, Any, Iterator
 from pathlib import Path
 
@@ -35,6 +36,21 @@ class ManusClient:
                 "No API key found. Please set MANUS_API_KEY environment variable "
                 "or configure it using 'manus configure'"
             )
+        
+        # Reuse one pooled keep-alive connection across requests
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+        )
+        self._session.headers.update({
+            "accept": "application/json",
+            "API_KEY": self.api_key,
+        })
+    
+    def close(self) -> None:
+        """Close pooled HTTP connections"""
+        self._session.close()
     
     def _get_api_key(self) -> Optional[str]:
         """Get API key from config file or environment variable"""
@@ -95,21 +111,14 @@ class ManusClient:
         Raises:
             ManusAPIError: If the API request fails
         """
-        headers = {
-            "accept": "application/json",
-            "content-type": "application/json",
-            "API_KEY": self.api_key,
-        }
-        
         payload = {
             "prompt": prompt,
             "mode": mode
         }
         
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.API_URL, 
-                headers=headers, 
                 json=payload,
                 stream=stream
             )
@@ -144,15 +153,9 @@ class ManusClient:
         Raises:
             ManusAPIError: If the API request fails
         """
-        headers = {
-            "accept": "application/json",
-            "API_KEY": self.api_key,
-        }
-        
         try:
-            response = requests.get(
-                f"{self.API_URL}/{task_id}",
-                headers=headers
+            response = self._session.get(
+                f"{self.API_URL}/{task_id}"
             )
             response.raise_for_status()
             return response.json()
@@ -5,9 +5,20 @@ Enhanced Manus API client with streaming, error handling, and retry logic
 import os
 import json
 import time
+import queue
+import random
+import socket
+import threading
+import uuid
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional, Dict, Any, Iterator, Callable
 from pathlib import Path
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from . import fastjson
+from .fileutils import atomic_write, read_json
 
 
 class ManusAPIError(Exception):
@@ -17,7 +28,50 @@ class ManusAPIError(Exception):
 
 class RateLimitError(ManusAPIError):
     """Raised when rate limit is exceeded"""
-    pass
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given as delta-seconds or an HTTP-date"""
+    if not value:
+        return None
+    
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _abort_response(response: requests.Response) -> None:
+    """Close a streamed response, waking any thread blocked reading it"""
+    # close() alone leaves a blocked recv() waiting for its read timeout;
+    # shutting the socket down makes it return at once
+    sock = getattr(getattr(getattr(response.raw, "_fp", None), "fp", None), "raw", None)
+    sock = getattr(sock, "_sock", None)
+    if sock is not None:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+    response.close()
+
+
+def _saved_at(history_file: Path) -> int:
+    """Save time encoded in a '<timestamp>__<id>.json' history filename"""
+    timestamp = history_file.name.partition("__")[0]
+    return int(timestamp) if timestamp.isdigit() else -1
 
 
 class ManusClient:
@@ -44,17 +98,31 @@ class ManusClient:
                 "or configure it using 'manus configure'"
             )
         
+        # Reuse one pooled keep-alive connection across requests
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+        )
+        self._session.headers.update({
+            "accept": "application/json",
+            "API_KEY": self.api_key,
+        })
+        
         # Generate or use provided session ID
         if session_id:
             self.session_id = session_id
         else:
-            import uuid
-            from datetime import datetime
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             self.session_id = f"cli-{timestamp}-{uuid.uuid4().hex[:8]}"
         
         # Ensure history directory exists
         self.HISTORY_DIR.mkdir(parents=True, exist_ok=True)
+        self._conversation_files: Dict[str, Path] = {}
+    
+    def close(self) -> None:
+        """Close pooled HTTP connections"""
+        self._session.close()
     
     def _get_api_key(self) -> Optional[str]:
         """Get API key from config file or environment variable"""
@@ -64,38 +132,23 @@ class ManusClient:
             return api_key
         
         # Then try config file
-        if self.CONFIG_FILE.exists():
-            try:
-                with open(self.CONFIG_FILE, 'r') as f:
-                    config = json.load(f)
-                    return config.get("api_key")
-            except (json.JSONDecodeError, IOError):
-                pass
-        
-        return None
+        return self.load_config().get("api_key")
     
     @classmethod
     def save_config(cls, config: Dict[str, Any]) -> None:
         """Save complete configuration to file"""
         cls.CONFIG_DIR.mkdir(parents=True, exist_ok=True)
         
-        with open(cls.CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
-        
-        # Set restrictive permissions on config file
-        cls.CONFIG_FILE.chmod(0o600)
+        # Restrictive permissions are set before the file becomes visible
+        atomic_write(cls.CONFIG_FILE, fastjson.dumps(config, indent=True), mode=0o600)
     
     @classmethod
     def load_config(cls) -> Dict[str, Any]:
         """Load configuration from file"""
-        if cls.CONFIG_FILE.exists():
-            try:
-                with open(cls.CONFIG_FILE, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
-        
-        return {}
+        try:
+            return read_json(cls.CONFIG_FILE)
+        except (json.JSONDecodeError, IOError):
+            return {}
     
     @classmethod
     def save_api_key(cls, api_key: str) -> None:
@@ -109,16 +162,21 @@ class ManusClient:
         func: Callable,
         max_retries: int = 3,
         initial_delay: float = 1.0,
-        backoff_factor: float = 2.0
+        backoff_factor: float = 2.0,
+        max_delay: float = 30.0
     ) -> Any:
         """
-        Retry a function with exponential backoff
+        Retry a function with jittered exponential backoff
+        
+        Rate-limited requests wait at least as long as the server's
+        Retry-After header asks for.
         
         Args:
             func: Function to retry
             max_retries: Maximum number of retry attempts
             initial_delay: Initial delay in seconds
             backoff_factor: Multiplier for delay after each retry
+            max_delay: Upper bound for the backoff delay in seconds
             
         Returns:
             Result from successful function call
@@ -135,15 +193,19 @@ class ManusClient:
             except RateLimitError as e:
                 last_exception = e
                 if attempt < max_retries:
-                    time.sleep(delay)
-                    delay *= backoff_factor
+                    # Jitter spreads out retries from many clients at once
+                    wait = delay * (0.5 + random.random())
+                    if e.retry_after is not None:
+                        wait = max(e.retry_after, wait)
+                    time.sleep(wait)
+                    delay = min(delay * backoff_factor, max_delay)
                 else:
                     raise
             except requests.exceptions.RequestException as e:
                 last_exception = e
                 if attempt < max_retries:
-                    time.sleep(delay)
-                    delay *= backoff_factor
+                    time.sleep(delay * (0.5 + random.random()))
+                    delay = min(delay * backoff_factor, max_delay)
                 else:
                     raise ManusAPIError(f"Request failed after {max_retries} retries: {e}")
         
@@ -155,7 +217,8 @@ class ManusClient:
         mode: str = "speed",
         system_prompt: Optional[str] = None,
         stream: bool = False,
-        retry: bool = True
+        retry: bool = True,
+        timeout: Any = 30
     ) -> Dict[str, Any]:
         """
         Create a new task via Manus API
@@ -166,6 +229,7 @@ class ManusClient:
             system_prompt: Optional system prompt to set role/behavior
             stream: Whether to stream the response
             retry: Whether to retry on failure
+            timeout: Seconds, or a (connect, read) tuple, passed to requests
             
         Returns:
             Task data from API response or response object if streaming
@@ -173,12 +237,6 @@ class ManusClient:
         Raises:
             ManusAPIError: If the API request fails
         """
-        headers = {
-            "accept": "application/json",
-            "content-type": "application/json",
-            "API_KEY": self.api_key,
-        }
-        
         payload = {
             "prompt": prompt,
             "mode": mode,
@@ -190,17 +248,19 @@ class ManusClient:
             payload["system_prompt"] = system_prompt
         
         def make_request():
-            response = requests.post(
+            response = self._session.post(
                 self.API_URL, 
-                headers=headers, 
                 json=payload,
                 stream=stream,
-                timeout=30
+                timeout=timeout
             )
             
             # Check for rate limiting
             if response.status_code == 429:
-                raise RateLimitError("Rate limit exceeded. Please try again later.")
+                raise RateLimitError(
+                    "Rate limit exceeded. Please try again later.",
+                    retry_after=_parse_retry_after(response.headers.get("Retry-After"))
+                )
             
             response.raise_for_status()
             
@@ -236,7 +296,10 @@ class ManusClient:
         self,
         prompt: str,
         mode: str = "speed",
-        system_prompt: Optional[str] = None
+        system_prompt: Optional[str] = None,
+        timeout: Any = 30,
+        retry: bool = False,
+        require_done: bool = False
     ) -> Iterator[str]:
         """
         Stream task responses chunk by chunk
@@ -245,39 +308,58 @@ class ManusClient:
             prompt: The prompt/query to send to Manus
             mode: Execution mode
             system_prompt: Optional system prompt
+            timeout: Seconds, or a (connect, read) tuple, passed to requests
+            retry: Whether to retry creating the task on failure
+            require_done: Treat a stream that ends without [DONE] as an error
             
         Yields:
             Response chunks as they arrive
             
         Raises:
-            ManusAPIError: If the API request fails
+            ManusAPIError: If the API request fails, the task reports that it
+                failed, or (with require_done) the stream ends before [DONE]
         """
         response = self.create_task(
             prompt=prompt,
             mode=mode,
             system_prompt=system_prompt,
             stream=True,
-            retry=False
+            retry=retry,
+            timeout=timeout
         )
         
+        yield from self._read_stream(response, require_done)
+    
+    @staticmethod
+    def _read_stream(response: requests.Response, require_done: bool = False) -> Iterator[str]:
+        """Yield the content chunks of a task's event stream, then close it"""
         try:
-            for line in response.iter_lines():
-                if line:
-                    decoded_line = line.decode('utf-8')
-                    # Handle server-sent events format
-                    if decoded_line.startswith('data: '):
-                        data = decoded_line[6:]  # Remove 'data: ' prefix
-                        if data.strip() == '[DONE]':
-                            break
-                        try:
-                            chunk = json.loads(data)
-                            if 'content' in chunk:
-                                yield chunk['content']
-                        except json.JSONDecodeError:
-                            # If not JSON, yield the raw data
-                            yield data
+            # Work on raw bytes; only non-JSON payloads ever get decoded
+            for line in response.iter_lines(decode_unicode=False):
+                # Handle server-sent events format
+                if not line.startswith(b'data: '):
+                    continue
+                data = line[6:]  # Remove 'data: ' prefix
+                if data.strip() == b'[DONE]':
+                    return
+                try:
+                    chunk = fastjson.loads(data)
+                except json.JSONDecodeError:
+                    # If not JSON, yield the raw data
+                    yield data.decode('utf-8')
+                    continue
+                if not isinstance(chunk, dict):
+                    continue
+                if chunk.get('status') == 'failed':
+                    raise ManusAPIError(f"Task failed: {chunk.get('error', 'Unknown error')}")
+                if 'content' in chunk:
+                    yield chunk['content']
         finally:
             response.close()
+        
+        if require_done:
+            # The connection closed without the terminal event
+            raise ManusAPIError("Response stream ended before the task completed")
     
     def get_task_status(self, task_id: str) -> Dict[str, Any]:
         """
@@ -292,15 +374,9 @@ class ManusClient:
         Raises:
             ManusAPIError: If the API request fails
         """
-        headers = {
-            "accept": "application/json",
-            "API_KEY": self.api_key,
-        }
-        
         def make_request():
-            response = requests.get(
+            response = self._session.get(
                 f"{self.API_URL}/{task_id}",
-                headers=headers,
                 timeout=30
             )
             response.raise_for_status()
@@ -311,69 +387,152 @@ class ManusClient:
         except requests.exceptions.RequestException as e:
             raise ManusAPIError(f"Failed to get task status: {e}")
     
-    def save_conversation(self, conversation_id: str, messages: list) -> None:
-        """Save conversation history to file"""
+    def _find_conversation(self, conversation_id: str) -> Optional[Path]:
+        """Locate the history file for a conversation, if any"""
+        history_file = self._conversation_files.get(conversation_id)
+        if history_file is not None:
+            return history_file
+        
+        matches = sorted(
+            self.HISTORY_DIR.glob(f"*__{conversation_id}.json"), key=_saved_at
+        )
+        if matches:
+            # A crash between writing a save and removing the previous file
+            # leaves both behind; the newest one wins
+            for stale_file in matches[:-1]:
+                stale_file.unlink(missing_ok=True)
+                stale_file.with_suffix(".meta").unlink(missing_ok=True)
+            return matches[-1]
+        
+        # Files written before timestamps moved into the filename
         history_file = self.HISTORY_DIR / f"{conversation_id}.json"
+        if history_file.exists():
+            return history_file
         
-        with open(history_file, 'w') as f:
-            json.dump({
-                "id": conversation_id,
-                "messages": messages,
-                "timestamp": time.time()
-            }, f, indent=2)
+        return None
+    
+    def save_conversation(self, conversation_id: str, messages: list) -> None:
+        """
+        Save conversation history to file
+        
+        Files are named '<timestamp>__<id>.json' with a '.meta' sidecar holding
+        the message count, so listing never has to parse the histories.
+        """
+        timestamp = time.time()
+        history_file = self.HISTORY_DIR / f"{int(timestamp)}__{conversation_id}.json"
+        
+        previous_file = self._find_conversation(conversation_id)
+        
+        atomic_write(history_file, fastjson.dumps({
+            "id": conversation_id,
+            "messages": messages,
+            "timestamp": timestamp
+        }, indent=True))
+        atomic_write(
+            history_file.with_suffix(".meta"),
+            fastjson.dumps({"count": len(messages)})
+        )
+        self._conversation_files[conversation_id] = history_file
+        
+        if previous_file is not None and previous_file != history_file:
+            previous_file.unlink(missing_ok=True)
+            previous_file.with_suffix(".meta").unlink(missing_ok=True)
     
     def load_conversation(self, conversation_id: str) -> Optional[Dict[str, Any]]:
         """Load conversation history from file"""
-        history_file = self.HISTORY_DIR / f"{conversation_id}.json"
+        history_file = self._find_conversation(conversation_id)
         
-        if history_file.exists():
+        if history_file is not None:
             try:
-                with open(history_file, 'r') as f:
-                    return json.load(f)
+                return fastjson.loads(history_file.read_bytes())
             except (json.JSONDecodeError, IOError):
                 pass
         
         return None
     
-    def list_conversations(self) -> list:
-        """List all saved conversations"""
+    def list_conversations(self, include_message_count: bool = True) -> list:
+        """
+        List all saved conversations
+        
+        Args:
+            include_message_count: Also read each conversation's '.meta'
+                sidecar to report its message count
+        """
         conversations = []
+        latest = {}
         
-        for file in self.HISTORY_DIR.glob("*.json"):
-            try:
-                with open(file, 'r') as f:
-                    data = json.load(f)
-                    conversations.append({
-                        "id": data.get("id"),
-                        "timestamp": data.get("timestamp"),
-                        "message_count": len(data.get("messages", []))
-                    })
-            except (json.JSONDecodeError, IOError):
-                pass
+        with os.scandir(self.HISTORY_DIR) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json"):
+                    continue
+                
+                stem = entry.name[:-5]
+                timestamp, sep, conversation_id = stem.partition("__")
+                
+                if sep and timestamp.isdigit():
+                    # Left-over older saves of the same conversation are skipped
+                    newest = latest.get(conversation_id)
+                    if newest is not None and newest["timestamp"] >= int(timestamp):
+                        continue
+                    conversation = {
+                        "id": conversation_id,
+                        "timestamp": int(timestamp)
+                    }
+                    if include_message_count:
+                        meta_file = self.HISTORY_DIR / f"{stem}.meta"
+                        try:
+                            count = fastjson.loads(meta_file.read_bytes())["count"]
+                        except (json.JSONDecodeError, IOError, KeyError):
+                            count = self._count_messages(entry.path)
+                        conversation["message_count"] = count
+                    latest[conversation_id] = conversation
+                    continue
+                
+                # Legacy '<id>.json' files carry everything in the body
+                try:
+                    data = fastjson.loads(Path(entry.path).read_bytes())
+                except (json.JSONDecodeError, IOError):
+                    continue
+                conversation = {
+                    "id": data.get("id"),
+                    "timestamp": data.get("timestamp")
+                }
+                if include_message_count:
+                    conversation["message_count"] = len(data.get("messages", []))
+                conversations.append(conversation)
+        
+        conversations.extend(latest.values())
         
         # Sort by timestamp, newest first
-        conversations.sort(key=lambda x: x.get("timestamp", 0), reverse=True)
+        conversations.sort(key=lambda x: x.get("timestamp") or 0, reverse=True)
         
         return conversations
+    
+    @staticmethod
+    def _count_messages(path: str) -> int:
+        """Count messages by parsing a full history file"""
+        try:
+            return len(fastjson.loads(Path(path).read_bytes()).get("messages", []))
+        except (json.JSONDecodeError, IOError):
+            return 0
 
     def chat(
         self,
         prompt: str,
         mode: str = "speed",
         system_prompt: Optional[str] = None,
-        poll_interval: float = 2.0,
         max_wait: int = 300
     ) -> str:
         """
-        Send a chat message and wait for the response (synchronous).
+        Send a chat message and wait for the full response (synchronous).
         
-        This method creates a task and polls until completion.
+        This method consumes the server-sent event stream of the task and
+        accumulates its chunks, so no status polling is needed.
         
         Args:
             prompt: The message to send
             mode: Execution mode (speed/balanced/quality)
             system_prompt: Optional system prompt
-            poll_interval: Seconds between status checks
             max_wait: Maximum seconds to wait for completion
             
         Returns:
@@ -382,53 +541,43 @@ class ManusClient:
         Raises:
             ManusAPIError: If the request fails or times out
         """
-        # Create the task
-        task_data = self.create_task(
-            prompt=prompt,
-            mode=mode,
-            system_prompt=system_prompt,
-            stream=False
-        )
-        
-        task_id = task_data.get("task_id")
-        if not task_id:
-            raise ManusAPIError("No task_id in response")
+        results = queue.Queue(maxsize=1)
+        responses = []
+        cancelled = threading.Event()
         
-        # Poll for completion
-        elapsed = 0
-        while elapsed < max_wait:
-            status_data = self.get_task_status(task_id)
-            
-            # Check status
-            status = status_data.get("status")
-            
-            if status == "completed":
-                # Extract result from output array
-                output_array = status_data.get("output", [])
-                
-                # Find the last assistant message with content
-                for item in reversed(output_array):
-                    if item.get("role") == "assistant" and "content" in item:
-                        content = item.get("content", [])
-                        if content and len(content) > 0:
-                            text = content[0].get("text", "")
-                            if text:
-                                return text
-                
-                # Fallback: return empty if no content found
-                return ""
-            
-            elif status == "failed":
-                error = status_data.get("error", "Unknown error")
-                raise ManusAPIError(f"Task failed: {error}")
-            
-            elif status in ["pending", "running"]:
-                # Still processing, wait and retry
-                time.sleep(poll_interval)
-                elapsed += poll_interval
-            
-            else:
-                # Unknown status
-                raise ManusAPIError(f"Unknown task status: {status}")
+        def consume():
+            try:
+                response = self.create_task(
+                    prompt=prompt,
+                    mode=mode,
+                    system_prompt=system_prompt,
+                    stream=True,
+                    retry=True,
+                    timeout=(10, max_wait)
+                )
+                responses.append(response)
+                if cancelled.is_set():
+                    # Timed out while the task was being created
+                    response.close()
+                    return
+                results.put(("ok", "".join(self._read_stream(response, require_done=True))))
+            except requests.exceptions.RequestException as e:
+                results.put(("error", ManusAPIError(f"Streaming response failed: {e}")))
+            except Exception as e:
+                results.put(("error", e))
         
-        raise ManusAPIError(f"Task timed out after {max_wait} seconds")
+        # The stream is read on a worker so max_wait bounds the whole call,
+        # not just the gaps between chunks
+        threading.Thread(target=consume, daemon=True).start()
+        try:
+            kind, value = results.get(timeout=max_wait)
+        except queue.Empty:
+            # Abort the stream so the worker and its connection end now
+            cancelled.set()
+            for response in responses:
+                _abort_response(response)
+            raise ManusAPIError(f"Task timed out after {max_wait} seconds")
+        
+        if kind == "error":
+            raise value
+        return value
@@ -1,9 +1,14 @@
 """Prompt Caching for Manus CLI v5.2"""
 import hashlib
-import json
+import os
+import string
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+
+from .. import fastjson
+from ..fileutils import atomic_write
 
 class PromptCache:
     """Caches prompts and responses for performance."""
@@ -12,39 +17,101 @@ class PromptCache:
         self.cache_dir = cache_dir or Path.home() / ".manus" / "cache"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.ttl = ttl
+        # Hot entries stay in memory as (response, timestamp), most recent last
+        self._mem: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._mem_max = 128
     
     def _get_cache_key(self, prompt: str, params: Dict[str, Any]) -> str:
         """Generates cache key from prompt and parameters."""
-        data = f"{prompt}:{json.dumps(params, sort_keys=True)}"
-        return hashlib.sha256(data.encode()).hexdigest()
+        # Non-cryptographic use, so a 128-bit BLAKE2b digest is plenty and
+        # feeding the parts incrementally avoids building one large string
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(prompt.encode())
+        hasher.update(b":")
+        hasher.update(fastjson.dumps(params, sort_keys=True))
+        return hasher.hexdigest()
+    
+    def _get_cache_file(self, key: str) -> Path:
+        """Shards entries into two levels of subdirectories by key prefix."""
+        return self.cache_dir / key[:2] / key[2:4] / f"{key}.txt"
     
     def get(self, prompt: str, params: Dict[str, Any]) -> Optional[str]:
         """Retrieves cached response if available and not expired."""
         key = self._get_cache_key(prompt, params)
-        cache_file = self.cache_dir / f"{key}.json"
         
-        if not cache_file.exists():
+        entry = self._mem.get(key)
+        if entry is not None:
+            if time.time() - entry[1] <= self.ttl:
+                self._mem.move_to_end(key)
+                return entry[0]
+            del self._mem[key]
+        
+        # The response is stored verbatim and its mtime is the write time,
+        # so expired entries are dropped without opening the file
+        cache_file = self._get_cache_file(key)
+        try:
+            timestamp = cache_file.stat().st_mtime
+        except OSError:
             return None
         
-        data = json.loads(cache_file.read_text())
-        if time.time() - data["timestamp"] > self.ttl:
-            cache_file.unlink()
+        if time.time() - timestamp > self.ttl:
+            cache_file.unlink(missing_ok=True)
             return None
         
-        return data["response"]
+        try:
+            response = cache_file.read_bytes().decode("utf-8")
+        except OSError:
+            return None
+        
+        self._remember(key, response, timestamp)
+        return response
     
     def set(self, prompt: str, params: Dict[str, Any], response: str):
         """Caches response."""
         key = self._get_cache_key(prompt, params)
-        cache_file = self.cache_dir / f"{key}.json"
-        cache_file.write_text(json.dumps({
-            "prompt": prompt,
-            "params": params,
-            "response": response,
-            "timestamp": time.time()
-        }))
+        cache_file = self._get_cache_file(key)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        now = time.time()
+        atomic_write(cache_file, response.encode("utf-8"), durable=False)
+        os.utime(cache_file, (now, now))
+        self._remember(key, response, now)
+    
+    def _remember(self, key: str, response: str, timestamp: float):
+        """Adds an entry to the in-memory LRU, evicting the oldest."""
+        self._mem[key] = (response, timestamp)
+        self._mem.move_to_end(key)
+        if len(self._mem) > self._mem_max:
+            self._mem.popitem(last=False)
     
     def clear(self):
-        """Clears all cached entries."""
-        for file in self.cache_dir.glob("*.json"):
-            file.unlink()
+        """Clears all cached entries.
+        
+        Only files named after cache keys are removed (sharded entries and
+        older unsharded '<key>.json' ones), along with shard directories
+        left empty; anything else in cache_dir is left alone.
+        """
+        self._mem.clear()
+        for cache_file in self.cache_dir.glob("??/??/*.txt"):
+            key = cache_file.stem
+            if _is_key(key, 32) and cache_file == self._get_cache_file(key):
+                cache_file.unlink(missing_ok=True)
+        for cache_file in self.cache_dir.glob("*.json"):
+            # Unsharded entries were keyed by SHA-256
+            if _is_key(cache_file.stem, 64):
+                cache_file.unlink(missing_ok=True)
+        
+        for shard in self.cache_dir.glob("??/??"):
+            for directory in (shard, shard.parent):
+                try:
+                    directory.rmdir()
+                except OSError:
+                    # Not empty, or already removed
+                    pass
+
+
+_HEX_DIGITS = frozenset(string.hexdigits.lower())
+
+
+def _is_key(name: str, length: int) -> bool:
+    """Whether a file stem is a cache key of `length` lowercase hex digits."""
+    return len(name) == length and _HEX_DIGITS.issuperset(name)
@@ -2,32 +2,140 @@
 Enhanced CLI application with streaming, roles, and conversation history
 """
 
-import sys
-import uuid
+import functools
+import os
+import time
 import typer
-from typing import Optional
-from datetime import datetime
+from dataclasses import dataclass, field
+from contextlib import contextmanager
+from typing import Iterable, Optional, TYPE_CHECKING
 from rich.console import Console
-from rich.markdown import Markdown
+from rich.markup import escape
 from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
-from rich.live import Live
-from rich.table import Table
-from rich import print as rprint
+from rich.prompt import Prompt
 
-from .api_enhanced import ManusClient, ManusAPIError, RateLimitError
 from .roles import get_role, list_roles, get_system_prompt
 from . import __version__
+from . import fastjson
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
+    from rich.table import Table
+    from .api_enhanced import ManusClient
+
+# The API client (and requests with it) is imported inside the commands
+# that talk to the API, so `--version` and `--help` start quickly
 
 app = typer.Typer(
     name="manus",
     help="Manus AI - Enhanced command-line interface for interacting with Manus AI",
-    add_completion=True,
+    # Completion support is only loaded when it is actually used; see
+    # `manus completions install` and run()
+    add_completion=False,
+    no_args_is_help=True,
 )
 
 console = Console()
 
 
+@functools.lru_cache(maxsize=1)
+def _get_client() -> "ManusClient":
+    """Return one client per process so its HTTP connection pool is reused"""
+    from .api_enhanced import ManusClient
+    return ManusClient()
+
+
+@contextmanager
+def _status(message: str):
+    """Show a spinner while the block runs, but only on a terminal"""
+    # When output is piped nobody sees the spinner, and its refresh thread
+    # would write control codes into the output
+    if console.is_terminal:
+        with console.status(message, spinner="dots"):
+            yield
+    else:
+        yield
+
+
+def _print_raw(data: dict) -> None:
+    """Write data as compact JSON, skipping Rich's JSON highlighter"""
+    out = console.file
+    out.write(fastjson.dumps(data).decode("utf-8"))
+    out.write("\n")
+
+
+def _write_stream(chunks: Iterable[str], flush_interval: float = 0.05) -> str:
+    """
+    Write streamed chunks to the terminal and return the full text
+    
+    Chunks go straight to the console's file instead of through
+    console.print, and are flushed on newlines or every flush_interval
+    seconds rather than once per chunk.
+    """
+    out = console.file
+    # Bound once; this loop runs for every token of the reply
+    write, flush = out.write, out.flush
+    parts = []
+    append = parts.append
+    monotonic = time.monotonic
+    last_flush = monotonic()
+    
+    for chunk in chunks:
+        write(chunk)
+        append(chunk)
+        now = monotonic()
+        if "\n" in chunk or now - last_flush >= flush_interval:
+            flush()
+            last_flush = now
+    
+    write("\n")
+    flush()
+    return "".join(parts)
+
+
+def _response_text(response: dict) -> str:
+    """Extract the assistant's text from a task response"""
+    output = response.get("output")
+    if isinstance(output, list):
+        # Task output is a list of messages; the reply is the last
+        # assistant message's first text part
+        for item in reversed(output):
+            if not isinstance(item, dict) or item.get("role") != "assistant":
+                continue
+            content = item.get("content")
+            if isinstance(content, list) and content and isinstance(content[0], dict):
+                text = content[0].get("text")
+                if isinstance(text, str) and text:
+                    return text
+    
+    for key in ("output", "message", "text"):
+        value = response.get(key)
+        if isinstance(value, str) and value:
+            return value
+    # Unknown shape: keep the whole response, as history always did
+    return str(response)
+
+
+@functools.lru_cache(maxsize=2)
+def _roles_table(with_description: bool = False) -> "Table":
+    """Build the roles table once; roles are static so it can be reprinted"""
+    from rich.table import Table
+    
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Key", style="cyan")
+    table.add_column("Name", style="green")
+    if with_description:
+        table.add_column("Description", style="white")
+    
+    for role in list_roles():
+        if with_description:
+            table.add_row(role["key"], role["name"], role["description"])
+        else:
+            table.add_row(role["key"], role["name"])
+    
+    return table
+
+
 def version_callback(value: bool):
     """Display version information"""
     if value:
@@ -84,7 +192,10 @@ def configure(
     Example:
         manus configure --api-key sk-your-api-key --role developer --stream
     """
-    config = ManusClient.load_config()
+    from .api_enhanced import ManusClient
+    
+    original = ManusClient.load_config()
+    config = dict(original)
     
     if not api_key and not config.get("api_key"):
         console.print("[bold yellow]Configure Manus CLI[/bold yellow]\n")
@@ -105,7 +216,8 @@ def configure(
     if stream is not None:
         config["stream"] = stream
     
-    if config:
+    # Skip the write entirely when nothing was changed
+    if config != original:
         ManusClient.save_config(config)
         console.print("\n[green]✓[/green] Configuration saved successfully!")
         console.print(f"[dim]Configuration stored in: {ManusClient.CONFIG_FILE}[/dim]")
@@ -130,20 +242,7 @@ def roles():
         manus roles
     """
     console.print("[bold cyan]Available Roles[/bold cyan]\n")
-    
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("Key", style="cyan")
-    table.add_column("Name", style="green")
-    table.add_column("Description", style="white")
-    
-    for role in list_roles():
-        table.add_row(
-            role["key"],
-            role["name"],
-            role["description"]
-        )
-    
-    console.print(table)
+    console.print(_roles_table(with_description=True))
     console.print("\n[dim]Use '/role <key>' in interactive mode or '--role <key>' in commands[/dim]")
 
 
@@ -185,25 +284,28 @@ def chat(
         manus chat "Write a Python function" --role developer --stream
         manus chat --interactive  # Start interactive session
     """
+    from .api_enhanced import ManusClient, ManusAPIError
+    
     try:
-        client = ManusClient()
+        client = _get_client()
     except ManusAPIError as e:
         console.print(f"[red]Error: {e}[/red]")
         console.print("\n[yellow]Tip:[/yellow] Run 'manus configure' to set up your API key")
         raise typer.Exit(1)
     
-    # Load config for defaults
-    config = ManusClient.load_config()
-    
-    # Use config defaults if not specified
-    if mode is None:
-        mode = config.get("default_mode", "speed")
-    
-    if role is None:
-        role = config.get("default_role", "assistant")
-    
-    if stream is None:
-        stream = config.get("stream", False)
+    # Use config defaults if not specified; the config is only read
+    # when at least one of them is needed
+    if mode is None or role is None or stream is None:
+        config = ManusClient.load_config()
+        
+        if mode is None:
+            mode = config.get("default_mode", "speed")
+        
+        if role is None:
+            role = config.get("default_role", "assistant")
+        
+        if stream is None:
+            stream = config.get("stream", False)
     
     if interactive or not message:
         _interactive_chat(client, mode, role, stream)
@@ -211,9 +313,11 @@ def chat(
         _single_message(client, message, mode, role, stream)
 
 
-def _single_message(client: ManusClient, message: str, mode: str, role: str, stream: bool):
+def _single_message(client: "ManusClient", message: str, mode: str, role: str, stream: bool):
     """Send a single message and display response"""
-    console.print(f"\n[bold cyan]You:[/bold cyan] {message}\n")
+    from .api_enhanced import ManusAPIError, RateLimitError
+    
+    console.print(f"\n[bold cyan]You:[/bold cyan] {escape(message)}\n")
     
     system_prompt = get_system_prompt(role)
     
@@ -221,12 +325,9 @@ def _single_message(client: ManusClient, message: str, mode: str, role: str, str
         if stream:
             console.print("[bold magenta]Manus:[/bold magenta] ", end="")
             
-            for chunk in client.stream_task(message, mode=mode, system_prompt=system_prompt):
-                console.print(chunk, end="")
-            
-            console.print()  # New line after streaming
+            _write_stream(client.stream_task(message, mode=mode, system_prompt=system_prompt))
         else:
-            with console.status("[bold green]Manus is thinking...", spinner="dots"):
+            with _status("[bold green]Manus is thinking..."):
                 response = client.create_task(message, mode=mode, system_prompt=system_prompt)
             
             console.print("[bold magenta]Manus:[/bold magenta]")
@@ -253,21 +354,176 @@ def _single_message(client: ManusClient, message: str, mode: str, role: str, str
         raise typer.Exit(1)
 
 
-def _interactive_chat(client: ManusClient, mode: str, role: str, stream: bool):
+@dataclass
+class ChatState:
+    """Mutable state of an interactive chat session"""
+    client: "ManusClient"
+    conversation_id: str
+    mode: str
+    role: str
+    stream: bool
+    saver: "ThreadPoolExecutor"
+    messages: list = field(default_factory=list)
+    # Derived from role by set_role(), so they are resolved once per role
+    # change instead of for every message
+    role_info: dict = field(init=False)
+    system_prompt: str = field(init=False)
+    
+    def __post_init__(self):
+        self.set_role(self.role)
+    
+    def set_role(self, role: str) -> None:
+        """Switch role along with its info and system prompt"""
+        self.role = role
+        self.role_info = get_role(role)
+        self.system_prompt = get_system_prompt(role)
+    
+    def save(self) -> "Future":
+        """Save a snapshot of the conversation on the background saver"""
+        # Copy the list so later appends don't race with serialization
+        return self.saver.submit(
+            self.client.save_conversation, self.conversation_id, list(self.messages)
+        )
+
+
+def _cmd_quit(arg: str, state: ChatState) -> bool:
+    """Offer to save the conversation and end the session"""
+    from rich.prompt import Confirm
+    
+    if state.messages:
+        save = Confirm.ask("Save conversation before exiting?")
+        if save:
+            try:
+                state.save().result()
+                console.print(f"[green]Conversation saved: {state.conversation_id}[/green]")
+            except Exception as e:
+                console.print(f"[red]Error saving conversation: {e}[/red]")
+    console.print("[yellow]Goodbye![/yellow]")
+    return True
+
+
+def _cmd_clear(arg: str, state: ChatState) -> bool:
+    """Clear the screen"""
+    console.clear()
+    return False
+
+
+def _cmd_mode(arg: str, state: ChatState) -> bool:
+    """Change the execution mode"""
+    if not arg:
+        console.print("[red]Usage: /mode <mode>[/red]")
+        return False
+    state.mode = arg
+    console.print(f"[green]Mode changed to: {escape(state.mode)}[/green]")
+    return False
+
+
+def _cmd_role(arg: str, state: ChatState) -> bool:
+    """Change the role/persona"""
+    if not arg:
+        console.print("[red]Usage: /role <role>[/red]")
+        return False
+    # Role keys are all lowercase
+    state.set_role(arg.lower())
+    console.print(f"[green]Role changed to: {state.role_info['name']}[/green]")
+    return False
+
+
+def _cmd_stream(arg: str, state: ChatState) -> bool:
+    """Toggle streaming"""
+    state.stream = not state.stream
+    console.print(f"[green]Streaming {'enabled' if state.stream else 'disabled'}[/green]")
+    return False
+
+
+def _cmd_save(arg: str, state: ChatState) -> bool:
+    """Save the conversation"""
+    # Wait for the write so a failed save is reported rather than hidden
+    try:
+        state.save().result()
+        console.print(f"[green]Conversation saved: {state.conversation_id}[/green]")
+    except Exception as e:
+        console.print(f"[red]Error saving conversation: {e}[/red]")
+    return False
+
+
+def _cmd_history(arg: str, state: ChatState) -> bool:
+    """Show the conversation history"""
+    # Rendered with a single print rather than one per message
+    lines = [f"\n[bold]Conversation History ({len(state.messages)} messages):[/bold]"]
+    for i, msg in enumerate(state.messages, 1):
+        role_label = "You" if msg["role"] == "user" else "Manus"
+        content = msg["content"]
+        preview = content[:100] + "..." if len(content) > 100 else content
+        lines.append(f"\n[cyan]{i}. {role_label}:[/cyan] {escape(preview)}")
+    console.print("\n".join(lines))
+    return False
+
+
+def _cmd_roles(arg: str, state: ChatState) -> bool:
+    """List available roles"""
+    console.print(_roles_table())
+    return False
+
+
+_HELP_PANEL = Panel(
+    "[bold]Available Commands:[/bold]\n"
+    "  /quit, /exit - Exit the chat\n"
+    "  /clear - Clear the screen\n"
+    "  /mode <mode> - Change execution mode\n"
+    "  /role <role> - Change role/persona\n"
+    "  /stream - Toggle streaming\n"
+    "  /save - Save conversation\n"
+    "  /history - Show conversation history\n"
+    "  /roles - List available roles\n"
+    "  /help - Show this help\n",
+    border_style="blue"
+)
+
+
+def _cmd_help(arg: str, state: ChatState) -> bool:
+    """Show the available commands"""
+    console.print(_HELP_PANEL)
+    return False
+
+
+# Slash command handlers; each returns True when the session should end
+_CHAT_COMMANDS = {
+    "quit": _cmd_quit,
+    "exit": _cmd_quit,
+    "clear": _cmd_clear,
+    "mode": _cmd_mode,
+    "role": _cmd_role,
+    "stream": _cmd_stream,
+    "save": _cmd_save,
+    "history": _cmd_history,
+    "roles": _cmd_roles,
+    "help": _cmd_help,
+}
+
+
+def _interactive_chat(client: "ManusClient", mode: str, role: str, stream: bool):
     """Start an interactive chat session with conversation history"""
-    conversation_id = str(uuid.uuid4())
-    messages = []
-    current_mode = mode
-    current_role = role
-    current_stream = stream
+    from concurrent.futures import ThreadPoolExecutor
+    from uuid import uuid4
+    from .api_enhanced import ManusAPIError, RateLimitError
     
-    role_info = get_role(current_role)
+    state = ChatState(
+        client=client,
+        conversation_id=uuid4().hex,
+        mode=mode,
+        role=role,
+        stream=stream,
+        # Saves run one at a time on a single worker, in the order requested
+        saver=ThreadPoolExecutor(max_workers=1),
+    )
+    messages = state.messages
     
     console.print(Panel(
         f"[bold cyan]Manus AI - Interactive Chat[/bold cyan]\n\n"
-        f"[bold]Current Role:[/bold] {role_info['name']}\n"
-        f"[bold]Mode:[/bold] {current_mode}\n"
-        f"[bold]Streaming:[/bold] {'Enabled' if current_stream else 'Disabled'}\n\n"
+        f"[bold]Current Role:[/bold] {state.role_info['name']}\n"
+        f"[bold]Mode:[/bold] {escape(state.mode)}\n"
+        f"[bold]Streaming:[/bold] {'Enabled' if state.stream else 'Disabled'}\n\n"
         "[bold]Commands:[/bold]\n"
         "  /quit or /exit - Exit the chat\n"
         "  /clear - Clear the screen\n"
@@ -288,108 +544,36 @@ def _interactive_chat(client: ManusClient, mode: str, role: str, stream: bool):
             if not message.strip():
                 continue
             
-            # Handle commands
+            # Handle commands; only the command name is case-folded
             if message.startswith('/'):
-                command = message.lower().strip()
-                
-                if command in ['/quit', '/exit']:
-                    if messages:
-                        save = Confirm.ask("Save conversation before exiting?")
-                        if save:
-                            client.save_conversation(conversation_id, messages)
-                            console.print(f"[green]Conversation saved: {conversation_id}[/green]")
-                    console.print("[yellow]Goodbye![/yellow]")
-                    break
-                
-                elif command == '/clear':
-                    console.clear()
-                    continue
-                
-                elif command.startswith('/mode '):
-                    new_mode = command.split(' ', 1)[1].strip()
-                    current_mode = new_mode
-                    console.print(f"[green]Mode changed to: {current_mode}[/green]")
-                    continue
-                
-                elif command.startswith('/role '):
-                    new_role = command.split(' ', 1)[1].strip()
-                    role_info = get_role(new_role)
-                    current_role = new_role
-                    console.print(f"[green]Role changed to: {role_info['name']}[/green]")
-                    continue
-                
-                elif command == '/stream':
-                    current_stream = not current_stream
-                    console.print(f"[green]Streaming {'enabled' if current_stream else 'disabled'}[/green]")
-                    continue
+                verb, _, arg = message[1:].partition(' ')
+                verb = verb.strip().lower()
+                handler = _CHAT_COMMANDS.get(verb)
                 
-                elif command == '/save':
-                    client.save_conversation(conversation_id, messages)
-                    console.print(f"[green]Conversation saved: {conversation_id}[/green]")
-                    continue
-                
-                elif command == '/history':
-                    console.print(f"\n[bold]Conversation History ({len(messages)} messages):[/bold]")
-                    for i, msg in enumerate(messages, 1):
-                        role_label = "You" if msg["role"] == "user" else "Manus"
-                        console.print(f"\n[cyan]{i}. {role_label}:[/cyan] {msg['content'][:100]}...")
-                    continue
-                
-                elif command == '/roles':
-                    table = Table(show_header=True, header_style="bold magenta")
-                    table.add_column("Key", style="cyan")
-                    table.add_column("Name", style="green")
-                    
-                    for r in list_roles():
-                        table.add_row(r["key"], r["name"])
-                    
-                    console.print(table)
-                    continue
-                
-                elif command == '/help':
-                    console.print(Panel(
-                        "[bold]Available Commands:[/bold]\n"
-                        "  /quit, /exit - Exit the chat\n"
-                        "  /clear - Clear the screen\n"
-                        "  /mode <mode> - Change execution mode\n"
-                        "  /role <role> - Change role/persona\n"
-                        "  /stream - Toggle streaming\n"
-                        "  /save - Save conversation\n"
-                        "  /history - Show conversation history\n"
-                        "  /roles - List available roles\n"
-                        "  /help - Show this help\n",
-                        border_style="blue"
-                    ))
-                    continue
-                
-                else:
-                    console.print(f"[red]Unknown command: {command}[/red]")
+                if handler is None:
+                    console.print(f"[red]Unknown command: /{escape(verb)}[/red]")
                     console.print("[dim]Type /help for available commands[/dim]")
-                    continue
+                elif handler(arg.strip(), state):
+                    break
+                continue
             
             # Add user message to history
             messages.append({"role": "user", "content": message})
             
-            # Get system prompt for current role
-            system_prompt = get_system_prompt(current_role)
-            
             # Send message to API
             try:
-                if current_stream:
+                if state.stream:
                     console.print("\n[bold magenta]Manus:[/bold magenta] ", end="")
                     
-                    response_text = ""
-                    for chunk in client.stream_task(message, mode=current_mode, system_prompt=system_prompt):
-                        console.print(chunk, end="")
-                        response_text += chunk
-                    
-                    console.print()  # New line after streaming
+                    response_text = _write_stream(
+                        client.stream_task(message, mode=state.mode, system_prompt=state.system_prompt)
+                    )
                     
                     # Add assistant response to history
                     messages.append({"role": "assistant", "content": response_text})
                 else:
-                    with console.status("[bold green]Manus is thinking...", spinner="dots"):
-                        response = client.create_task(message, mode=current_mode, system_prompt=system_prompt)
+                    with _status("[bold green]Manus is thinking..."):
+                        response = client.create_task(message, mode=state.mode, system_prompt=state.system_prompt)
                     
                     console.print("\n[bold magenta]Manus:[/bold magenta]")
                     
@@ -400,8 +584,12 @@ def _interactive_chat(client: ManusClient, mode: str, role: str, stream: bool):
                     console.print(f"[dim]Task ID: {task_id} | Status: {status}[/dim]")
                     console.print_json(data=response)
                     
-                    # Add assistant response to history
-                    messages.append({"role": "assistant", "content": str(response)})
+                    # Keep only the reply text in the history, not the whole response
+                    messages.append({
+                        "role": "assistant",
+                        "content": _response_text(response),
+                        "task_id": response.get("task_id")
+                    })
                     
             except RateLimitError as e:
                 console.print(f"\n[red]Rate Limit Error:[/red] {e}")
@@ -415,6 +603,9 @@ def _interactive_chat(client: ManusClient, mode: str, role: str, stream: bool):
         except EOFError:
             console.print("\n[yellow]Goodbye![/yellow]")
             break
+    
+    # Let any queued save finish before returning
+    state.saver.shutdown(wait=True)
 
 
 @app.command()
@@ -431,27 +622,40 @@ def task(
         "--role",
         "-r",
         help="Role/persona to use"
+    ),
+    raw: bool = typer.Option(
+        False,
+        "--raw",
+        help="Print only the response as compact JSON"
     )
 ):
     """
     Create a new task and get the task ID
     
-    Example:
+    Examples:
         manus task "Analyze this data" --role data-scientist
+        manus task "Analyze this data" --raw | jq .task_id
     """
+    from .api_enhanced import ManusClient, ManusAPIError
+    
     try:
-        client = ManusClient()
-        config = ManusClient.load_config()
-        
-        if mode is None:
-            mode = config.get("default_mode", "speed")
-        
-        if role is None:
-            role = config.get("default_role", "assistant")
+        client = _get_client()
+        if mode is None or role is None:
+            config = ManusClient.load_config()
+            
+            if mode is None:
+                mode = config.get("default_mode", "speed")
+            
+            if role is None:
+                role = config.get("default_role", "assistant")
         
         system_prompt = get_system_prompt(role)
         
-        with console.status("[bold green]Creating task...", spinner="dots"):
+        if raw:
+            _print_raw(client.create_task(prompt, mode=mode, system_prompt=system_prompt))
+            return
+        
+        with _status("[bold green]Creating task..."):
             response = client.create_task(prompt, mode=mode, system_prompt=system_prompt)
         
         task_id = response.get('task_id')
@@ -470,18 +674,30 @@ def task(
 
 @app.command()
 def status(
-    task_id: str = typer.Argument(..., help="Task ID to check")
+    task_id: str = typer.Argument(..., help="Task ID to check"),
+    raw: bool = typer.Option(
+        False,
+        "--raw",
+        help="Print only the response as compact JSON"
+    )
 ):
     """
     Check the status of a task
     
-    Example:
+    Examples:
         manus status abc123def456
+        manus status abc123def456 --raw
     """
+    from .api_enhanced import ManusAPIError
+    
     try:
-        client = ManusClient()
+        client = _get_client()
+        
+        if raw:
+            _print_raw(client.get_task_status(task_id))
+            return
         
-        with console.status("[bold green]Fetching task status...", spinner="dots"):
+        with _status("[bold green]Fetching task status..."):
             response = client.get_task_status(task_id)
         
         console.print(f"\n[bold]Task Status:[/bold]")
@@ -493,16 +709,29 @@ def status(
 
 
 @app.command()
-def history():
+def history(
+    limit: Optional[int] = typer.Option(
+        None,
+        "--limit",
+        "-n",
+        min=1,
+        help="Show only the N most recent conversations"
+    )
+):
     """
     List saved conversation history
     
-    Example:
+    Examples:
         manus history
+        manus history --limit 10
     """
+    from rich.table import Table
+    
     try:
-        client = ManusClient()
+        client = _get_client()
         conversations = client.list_conversations()
+        if limit is not None:
+            conversations = conversations[:limit]
         
         if not conversations:
             console.print("[yellow]No saved conversations found[/yellow]")
@@ -515,11 +744,11 @@ def history():
         table.add_column("Date", style="green")
         table.add_column("Messages", style="white")
         
+        # time.strftime on the epoch value avoids a datetime object per row
         for conv in conversations:
-            timestamp = datetime.fromtimestamp(conv["timestamp"])
             table.add_row(
                 conv["id"][:16] + "...",
-                timestamp.strftime("%Y-%m-%d %H:%M"),
+                time.strftime("%Y-%m-%d %H:%M", time.localtime(conv["timestamp"])),
                 str(conv["message_count"])
             )
         
@@ -530,8 +759,41 @@ def history():
         raise typer.Exit(1)
 
 
+# Set by the shell when it asks manus for completions
+_COMPLETE_VAR = "_MANUS_COMPLETE"
+
+completions_app = typer.Typer(help="Manage shell completion")
+app.add_typer(completions_app, name="completions")
+
+
+@completions_app.command("install")
+def completions_install(
+    shell: Optional[str] = typer.Argument(
+        None,
+        help="Shell to install completion for (detected if omitted)"
+    )
+):
+    """
+    Install shell completion for manus
+    
+    Example:
+        manus completions install
+        manus completions install zsh
+    """
+    from typer.completion import completion_init, install
+    
+    completion_init()
+    shell, path = install(shell=shell, prog_name="manus", complete_var=_COMPLETE_VAR)
+    console.print(f"[green]✓[/green] {shell} completion installed in {path}")
+    console.print("[dim]Completion will take effect once you restart the terminal[/dim]")
+
+
 def run():
     """Entry point for the CLI"""
+    # Typer's completion machinery is only loaded when completing
+    if _COMPLETE_VAR in os.environ:
+        from typer.completion import completion_init
+        completion_init()
     app()
 
 
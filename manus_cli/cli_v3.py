@@ -2,24 +2,30 @@
 Manus CLI v3.0 with Spec-Driven Development integration
 """
 
-import sys
-import uuid
+import functools
+import os
+import queue
+import threading
+import time
 import typer
-from typing import Optional
-from datetime import datetime
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator, Optional, TYPE_CHECKING
 from pathlib import Path
 from rich.console import Console
-from rich.markdown import Markdown
+from rich.markup import escape
 from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
-from rich.live import Live
-from rich.table import Table
-from rich import print as rprint
+from rich.prompt import Prompt
 
-from .api_enhanced import ManusClient, ManusAPIError, RateLimitError
 from .roles import get_role, list_roles, get_system_prompt
-from .spec_driven import SpecDrivenProcess, create_enhanced_prompt
-from . import __version__
+from . import __version__, fastjson
+
+if TYPE_CHECKING:
+    from rich.table import Table
+    from .api_enhanced import ManusClient
+
+# The API client (and requests with it) and the spec-driven process are
+# imported inside the commands that use them, so `--version`, `--help`
+# and `roles` start quickly
 
 app = typer.Typer(
     name="manus",
@@ -30,11 +36,148 @@ app = typer.Typer(
 console = Console()
 
 
+@functools.lru_cache(maxsize=1)
+def _get_client() -> "ManusClient":
+    """Return one client per process so its HTTP connection pool is reused"""
+    from .api_enhanced import ManusClient
+    return ManusClient()
+
+
+class _StreamFlusher:
+    """
+    Batch streamed text into few terminal writes
+    
+    Streamed chunks are plain model output, so they skip console.print and
+    are buffered; the buffer is written to the console's file once it holds
+    max_chars characters or flush_interval seconds have passed, and when
+    the block exits (followed by a newline).
+    """
+    
+    def __init__(self, max_chars: int = 4096, flush_interval: float = 0.016):
+        self.out = console.file
+        self.max_chars = max_chars
+        self.flush_interval = flush_interval
+        self._buf = []
+        self._size = 0
+        self._last_flush = time.monotonic()
+    
+    def __enter__(self) -> "_StreamFlusher":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self._buf.append("\n")
+        self.flush()
+    
+    def write(self, chunk: str) -> None:
+        self._buf.append(chunk)
+        self._size += len(chunk)
+        if self._size >= self.max_chars or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+    
+    def flush(self) -> None:
+        if self._buf:
+            self.out.write("".join(self._buf))
+            self._buf.clear()
+            self._size = 0
+        self.out.flush()
+        self._last_flush = time.monotonic()
+
+
+# Chunks the reader thread may get ahead of the terminal by
+_READ_AHEAD_CHUNKS = 256
+
+
+def _read_ahead(chunks: Iterable[str], on_idle: Callable[[], None], idle_after: float) -> Iterator[str]:
+    """
+    Iterate chunks that are read on a background thread
+    
+    The HTTP stream is consumed by a daemon thread into a bounded queue, so
+    the next chunk is already being received while the current one is
+    written out. Whenever no chunk arrives for idle_after seconds, on_idle
+    is called (used to flush buffered output during pauses in the stream).
+    Errors raised by the stream are re-raised here. When iteration stops
+    early (an error, Ctrl+C or a break), the reader stops and the stream is
+    closed.
+    """
+    source = iter(chunks)
+    pending = queue.Queue(maxsize=_READ_AHEAD_CHUNKS)
+    stop = threading.Event()
+    
+    def put(item) -> bool:
+        # Waits for room in the queue, unless the consumer has gone away
+        while not stop.is_set():
+            try:
+                pending.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+    
+    def reader():
+        try:
+            for chunk in source:
+                if not put((chunk, None)):
+                    return
+        except BaseException as e:
+            put((None, e))
+        else:
+            put((None, None))
+        finally:
+            _close_stream(source)
+    
+    threading.Thread(target=reader, daemon=True).start()
+    
+    get = pending.get
+    try:
+        while True:
+            try:
+                chunk, error = get(timeout=idle_after)
+            except queue.Empty:
+                on_idle()
+                continue
+            if error is not None:
+                raise error
+            if chunk is None:
+                return
+            yield chunk
+    finally:
+        stop.set()
+        # Fails while the reader is inside the stream; it closes it on exit
+        _close_stream(source)
+
+
+def _close_stream(source: Iterator[str]) -> None:
+    """Close a chunk generator (and with it the HTTP response), if possible"""
+    close = getattr(source, "close", None)
+    if close is not None:
+        try:
+            close()
+        except ValueError:
+            # "generator already executing" in the other thread
+            pass
+
+
+# Rich's JSON highlighter re-parses the text and styles every token, which
+# is slow for big payloads; above this size the JSON is written as-is
+_PRETTY_JSON_LIMIT = 8192
+
+
+def _print_json(data: dict) -> None:
+    """Print data as indented JSON, highlighted only for small payloads on a terminal"""
+    text = fastjson.dumps(data, indent=True).decode("utf-8")
+    if console.is_terminal and len(text) < _PRETTY_JSON_LIMIT:
+        console.print_json(text)
+        return
+    out = console.file
+    out.write(text)
+    out.write("\n")
+
+
 def version_callback(value: bool):
     """Display version information"""
     if value:
-        console.print(f"[bold blue]Manus CLI[/bold blue] version [green]{__version__}[/green]")
-        console.print(f"[dim]With Spec-Driven Development support[/dim]")
+        # Plain text needs no markup parsing or rendering
+        typer.echo(f"Manus CLI version {__version__}\nWith Spec-Driven Development support")
         raise typer.Exit()
 
 
@@ -92,7 +235,10 @@ def configure(
     Example:
         manus configure --api-key sk-your-api-key --role developer --spec-driven
     """
-    config = ManusClient.load_config()
+    from .api_enhanced import ManusClient
+    
+    original = ManusClient.load_config()
+    config = dict(original)
     
     if not api_key and not config.get("api_key"):
         console.print("[bold yellow]Configure Manus CLI[/bold yellow]\n")
@@ -116,7 +262,8 @@ def configure(
     if spec_driven is not None:
         config["spec_driven"] = spec_driven
     
-    if config:
+    # Skip the write entirely when nothing was changed
+    if config != original:
         ManusClient.save_config(config)
         console.print("\n[green]✓[/green] Configuration saved successfully!")
         console.print(f"[dim]Configuration stored in: {ManusClient.CONFIG_FILE}[/dim]")
@@ -132,15 +279,10 @@ def configure(
         console.print("[red]No configuration changes made[/red]")
 
 
-@app.command()
-def roles():
-    """
-    List available roles/personas
-    
-    Example:
-        manus roles
-    """
-    console.print("[bold cyan]Available Roles[/bold cyan]\n")
+@functools.lru_cache(maxsize=1)
+def _roles_table() -> "Table":
+    """Build the roles table once; roles are static so it can be reprinted"""
+    from rich.table import Table
     
     table = Table(show_header=True, header_style="bold magenta")
     table.add_column("Key", style="cyan")
@@ -154,7 +296,19 @@ def roles():
             role["description"]
         )
     
-    console.print(table)
+    return table
+
+
+@app.command()
+def roles():
+    """
+    List available roles/personas
+    
+    Example:
+        manus roles
+    """
+    console.print("[bold cyan]Available Roles[/bold cyan]\n")
+    console.print(_roles_table())
     console.print("\n[dim]Use '/role <key>' in interactive mode or '--role <key>' in commands[/dim]")
 
 
@@ -208,46 +362,64 @@ def chat(
         manus chat "Build a REST API" --role developer
         manus chat --interactive
     """
+    _run_chat(message, mode, role, stream, interactive, spec_driven, working_dir)
+
+
+def _run_chat(
+    message: Optional[str],
+    mode: Optional[str],
+    role: Optional[str],
+    stream: Optional[bool],
+    interactive: bool,
+    spec_driven: Optional[bool],
+    working_dir: Optional[str]
+):
+    """Resolve config defaults and run a single message or an interactive session"""
+    from .api_enhanced import ManusClient, ManusAPIError
+    
     try:
-        client = ManusClient()
+        client = _get_client()
     except ManusAPIError as e:
         console.print(f"[red]Error: {e}[/red]")
         console.print("\n[yellow]Tip:[/yellow] Run 'manus configure' to set up your API key")
         raise typer.Exit(1)
     
-    # Load config for defaults
-    config = ManusClient.load_config()
-    
-    # Use config defaults if not specified
-    if mode is None:
-        mode = config.get("default_mode", "speed")
-    
-    if role is None:
-        role = config.get("default_role", "assistant")
-    
-    if stream is None:
-        stream = config.get("stream", False)
+    # Use config defaults if not specified; the config is only read
+    # when at least one of them is needed
+    if mode is None or role is None or stream is None:
+        config = ManusClient.load_config()
+        
+        if mode is None:
+            mode = config.get("default_mode", "speed")
+        
+        if role is None:
+            role = config.get("default_role", "assistant")
+        
+        if stream is None:
+            stream = config.get("stream", False)
     
     # Determine working directory
     work_dir = Path(working_dir) if working_dir else Path.cwd()
     
     if interactive or not message:
-        _interactive_chat_v3(client, mode, role, stream, work_dir, config)
+        _interactive_chat_v3(client, mode, role, stream, work_dir)
     else:
-        _single_message_v3(client, message, mode, role, stream, spec_driven, work_dir, config)
+        _single_message_v3(client, message, mode, role, stream, spec_driven, work_dir)
 
 
 def _single_message_v3(
-    client: ManusClient, 
+    client: "ManusClient", 
     message: str, 
     mode: str, 
     role: str, 
     stream: bool,
     spec_driven: Optional[bool],
-    working_dir: Path,
-    config: dict
+    working_dir: Path
 ):
     """Send a single message with optional spec-driven process"""
+    from rich.prompt import Confirm
+    from .api_enhanced import ManusAPIError, RateLimitError
+    from .spec_driven import SpecDrivenProcess, create_enhanced_prompt
     
     # Determine if spec-driven should be used
     use_spec_driven = False
@@ -259,7 +431,7 @@ def _single_message_v3(
         # Explicitly disabled
         use_spec_driven = False
     else:
-        # Auto-detect based on keywords and config
+        # Auto-detect based on keywords
         if SpecDrivenProcess.should_trigger(message):
             # Check if complex enough
             if SpecDrivenProcess.is_complex_task(message):
@@ -292,10 +464,10 @@ def _single_message_v3(
             if stream:
                 console.print("[bold magenta]Manus:[/bold magenta] ", end="")
                 
-                for chunk in client.stream_task(enhanced_prompt, mode=mode, system_prompt=system_prompt):
-                    console.print(chunk, end="")
-                
-                console.print()
+                with _StreamFlusher() as out:
+                    chunks = client.stream_task(enhanced_prompt, mode=mode, system_prompt=system_prompt)
+                    for chunk in _read_ahead(chunks, out.flush, out.flush_interval):
+                        out.write(chunk)
             else:
                 with console.status("[bold green]Manus is thinking with structured approach...", spinner="dots"):
                     response = client.create_task(enhanced_prompt, mode=mode, system_prompt=system_prompt)
@@ -305,13 +477,13 @@ def _single_message_v3(
                 task_id = response.get('task_id', 'N/A')
                 status = response.get('status', 'N/A')
                 
-                console.print(Panel(
-                    f"[dim]Task ID: {task_id}\nStatus: {status}\nSpec Dir: {spec_process.manus_dir}[/dim]",
-                    border_style="blue"
-                ))
+                console.print(
+                    f"[dim]Task ID: {escape(str(task_id))} | Status: {escape(str(status))} | "
+                    f"Spec Dir: {escape(str(spec_process.manus_dir))}[/dim]"
+                )
                 
                 console.print("\n[bold]Response:[/bold]")
-                console.print_json(data=response)
+                _print_json(response)
         
         except KeyboardInterrupt:
             console.print("\n[yellow]Spec-driven process interrupted[/yellow]")
@@ -319,7 +491,7 @@ def _single_message_v3(
     
     else:
         # Standard message without spec-driven
-        console.print(f"\n[bold cyan]You:[/bold cyan] {message}\n")
+        console.print(f"\n[bold cyan]You:[/bold cyan] {escape(message)}\n")
         
         system_prompt = get_system_prompt(role)
         
@@ -327,10 +499,10 @@ def _single_message_v3(
             if stream:
                 console.print("[bold magenta]Manus:[/bold magenta] ", end="")
                 
-                for chunk in client.stream_task(message, mode=mode, system_prompt=system_prompt):
-                    console.print(chunk, end="")
-                
-                console.print()
+                with _StreamFlusher() as out:
+                    chunks = client.stream_task(message, mode=mode, system_prompt=system_prompt)
+                    for chunk in _read_ahead(chunks, out.flush, out.flush_interval):
+                        out.write(chunk)
             else:
                 with console.status("[bold green]Manus is thinking...", spinner="dots"):
                     response = client.create_task(message, mode=mode, system_prompt=system_prompt)
@@ -346,7 +518,7 @@ def _single_message_v3(
                 ))
                 
                 console.print("\n[bold]Response:[/bold]")
-                console.print_json(data=response)
+                _print_json(response)
                 
         except RateLimitError as e:
             console.print(f"\n[red]Rate Limit Error:[/red] {e}")
@@ -357,134 +529,211 @@ def _single_message_v3(
             raise typer.Exit(1)
 
 
+@dataclass
+class ChatState:
+    """Mutable state of an interactive v3 chat session"""
+    client: "ManusClient"
+    conversation_id: str
+    mode: str
+    role: str
+    stream: bool
+    messages: list = field(default_factory=list)
+    force_spec_next: bool = False
+    # Derived from role by set_role(), so they are resolved once per role
+    # change instead of for every message
+    role_info: dict = field(init=False)
+    system_prompt: str = field(init=False)
+    
+    def __post_init__(self):
+        self._apply_role(self.role)
+    
+    def set_role(self, role: str) -> None:
+        """Switch role along with its info and system prompt"""
+        if role != self.role:
+            self._apply_role(role)
+    
+    def _apply_role(self, role: str) -> None:
+        self.role = role
+        self.role_info = get_role(role)
+        self.system_prompt = get_system_prompt(role)
+
+
+def _cmd_quit(arg: str, state: ChatState) -> bool:
+    """Offer to save the conversation and end the session"""
+    from rich.prompt import Confirm
+    
+    if state.messages:
+        save = Confirm.ask("Save conversation before exiting?")
+        if save:
+            state.client.save_conversation(state.conversation_id, state.messages)
+            console.print(f"[green]Conversation saved: {state.conversation_id}[/green]")
+    console.print("[yellow]Goodbye![/yellow]")
+    return True
+
+
+def _cmd_spec(arg: str, state: ChatState) -> bool:
+    """Force spec-driven mode for the next message"""
+    state.force_spec_next = True
+    console.print("[green]Spec-driven mode will be used for your next message[/green]")
+    return False
+
+
+def _cmd_role(arg: str, state: ChatState) -> bool:
+    """Change the role/persona"""
+    if not arg:
+        console.print("[red]Usage: /role <role>[/red]")
+        return False
+    # Role keys are all lowercase
+    state.set_role(arg.lower())
+    console.print(f"[green]Role changed to: {state.role_info['name']}[/green]")
+    return False
+
+
+def _cmd_stream(arg: str, state: ChatState) -> bool:
+    """Toggle streaming"""
+    state.stream = not state.stream
+    console.print(f"[green]Streaming {'enabled' if state.stream else 'disabled'}[/green]")
+    return False
+
+
+def _cmd_help(arg: str, state: ChatState) -> bool:
+    """Show the available commands"""
+    console.print(Panel(
+        "[bold]Available Commands:[/bold]\n"
+        "  /quit, /exit - Exit the chat\n"
+        "  /spec - Force spec-driven mode for next message\n"
+        "  /role <role> - Change role/persona\n"
+        "  /stream - Toggle streaming\n"
+        "  /save - Save conversation\n"
+        "  /history - Show conversation history\n"
+        "  /help - Show this help\n",
+        border_style="blue"
+    ))
+    return False
+
+
+# Slash command handlers; each returns True when the session should end
+_CHAT_COMMANDS = {
+    "quit": _cmd_quit,
+    "exit": _cmd_quit,
+    "spec": _cmd_spec,
+    "role": _cmd_role,
+    "stream": _cmd_stream,
+    "help": _cmd_help,
+}
+
+
+# Same look as Prompt.ask("[bold cyan]You[/bold cyan]"), pre-rendered so the
+# loop does not go through Rich's markup and rendering on every turn. The
+# escapes are wrapped in \001/\002 so readline leaves them out of the
+# prompt width and line editing keeps the cursor in place
+_YOU_PROMPT = "\n\001\x1b[1;36m\002You\001\x1b[0m\002: "
+
+# Only the role, mode, streaming flag and working directory vary per session
+_BANNER_TEMPLATE = (
+    "[bold cyan]Manus AI - Interactive Chat v3.0[/bold cyan]\n\n"
+    "[bold]Current Role:[/bold] %s\n"
+    "[bold]Mode:[/bold] %s\n"
+    "[bold]Streaming:[/bold] %s\n"
+    "[bold]Working Dir:[/bold] %s\n\n"
+    "[bold magenta]✨ Spec-Driven Development:[/bold magenta] Enabled\n"
+    "[dim]Use keywords like 'create', 'build', 'develop' to trigger structured thinking[/dim]\n\n"
+    "[bold]Commands:[/bold]\n"
+    "  /quit or /exit - Exit the chat\n"
+    "  /spec - Force spec-driven mode for next message\n"
+    "  /role <role> - Change role/persona\n"
+    "  /stream - Toggle streaming\n"
+    "  /help - Show all commands\n"
+)
+
+
 def _interactive_chat_v3(
-    client: ManusClient,
+    client: "ManusClient",
     mode: str,
     role: str,
     stream: bool,
-    working_dir: Path,
-    config: dict
+    working_dir: Path
 ):
     """Interactive chat with spec-driven support"""
-    conversation_id = str(uuid.uuid4())
-    messages = []
-    current_mode = mode
-    current_role = role
-    current_stream = stream
+    from .api_enhanced import ManusAPIError, RateLimitError
+    from .spec_driven import SpecDrivenProcess
     
-    role_info = get_role(current_role)
+    state = ChatState(
+        client=client,
+        conversation_id=os.urandom(16).hex(),
+        mode=mode,
+        role=role,
+        stream=stream,
+    )
+    messages = state.messages
     
     console.print(Panel(
-        f"[bold cyan]Manus AI - Interactive Chat v3.0[/bold cyan]\n\n"
-        f"[bold]Current Role:[/bold] {role_info['name']}\n"
-        f"[bold]Mode:[/bold] {current_mode}\n"
-        f"[bold]Streaming:[/bold] {'Enabled' if current_stream else 'Disabled'}\n"
-        f"[bold]Working Dir:[/bold] {working_dir}\n\n"
-        f"[bold magenta]✨ Spec-Driven Development:[/bold magenta] Enabled\n"
-        f"[dim]Use keywords like 'create', 'build', 'develop' to trigger structured thinking[/dim]\n\n"
-        "[bold]Commands:[/bold]\n"
-        "  /quit or /exit - Exit the chat\n"
-        "  /spec - Force spec-driven mode for next message\n"
-        "  /role <role> - Change role/persona\n"
-        "  /stream - Toggle streaming\n"
-        "  /help - Show all commands\n",
+        _BANNER_TEMPLATE % (
+            state.role_info['name'],
+            escape(state.mode),
+            'Enabled' if state.stream else 'Disabled',
+            escape(str(working_dir)),
+        ),
         border_style="blue"
     ))
     
-    force_spec_next = False
+    you_prompt = _YOU_PROMPT if console.is_terminal and console.color_system else "\nYou: "
     
     while True:
         try:
-            message = Prompt.ask("\n[bold cyan]You[/bold cyan]")
+            message = input(you_prompt)
             
             if not message.strip():
                 continue
             
-            # Handle commands
+            # Handle commands; only the command name is case-folded
             if message.startswith('/'):
-                command = message.lower().strip()
+                verb, _, arg = message[1:].partition(' ')
+                verb = verb.strip().lower()
+                handler = _CHAT_COMMANDS.get(verb)
                 
-                if command in ['/quit', '/exit']:
-                    if messages:
-                        save = Confirm.ask("Save conversation before exiting?")
-                        if save:
-                            client.save_conversation(conversation_id, messages)
-                            console.print(f"[green]Conversation saved: {conversation_id}[/green]")
-                    console.print("[yellow]Goodbye![/yellow]")
+                if handler is None:
+                    console.print(f"[red]Unknown command: /{escape(verb)}[/red]")
+                elif handler(arg.strip(), state):
                     break
-                
-                elif command == '/spec':
-                    force_spec_next = True
-                    console.print("[green]Spec-driven mode will be used for your next message[/green]")
-                    continue
-                
-                elif command.startswith('/role '):
-                    new_role = command.split(' ', 1)[1].strip()
-                    role_info = get_role(new_role)
-                    current_role = new_role
-                    console.print(f"[green]Role changed to: {role_info['name']}[/green]")
-                    continue
-                
-                elif command == '/stream':
-                    current_stream = not current_stream
-                    console.print(f"[green]Streaming {'enabled' if current_stream else 'disabled'}[/green]")
-                    continue
-                
-                elif command == '/help':
-                    console.print(Panel(
-                        "[bold]Available Commands:[/bold]\n"
-                        "  /quit, /exit - Exit the chat\n"
-                        "  /spec - Force spec-driven mode for next message\n"
-                        "  /role <role> - Change role/persona\n"
-                        "  /stream - Toggle streaming\n"
-                        "  /save - Save conversation\n"
-                        "  /history - Show conversation history\n"
-                        "  /help - Show this help\n",
-                        border_style="blue"
-                    ))
-                    continue
-                
-                else:
-                    console.print(f"[red]Unknown command: {command}[/red]")
-                    continue
+                continue
             
             # Check if spec-driven should be used
-            use_spec = force_spec_next or (
+            use_spec = state.force_spec_next or (
                 SpecDrivenProcess.should_trigger(message) and 
                 SpecDrivenProcess.is_complex_task(message)
             )
             
-            force_spec_next = False  # Reset flag
+            state.force_spec_next = False  # Reset flag
             
             # Process message
             if use_spec:
                 _single_message_v3(
-                    client, message, current_mode, current_role, 
-                    current_stream, True, working_dir, config
+                    client, message, state.mode, state.role, 
+                    state.stream, True, working_dir
                 )
             else:
                 # Standard chat
                 messages.append({"role": "user", "content": message})
                 
-                system_prompt = get_system_prompt(current_role)
-                
                 try:
-                    if current_stream:
+                    if state.stream:
                         console.print("\n[bold magenta]Manus:[/bold magenta] ", end="")
                         
-                        response_text = ""
-                        for chunk in client.stream_task(message, mode=current_mode, system_prompt=system_prompt):
-                            console.print(chunk, end="")
-                            response_text += chunk
+                        parts = []
+                        with _StreamFlusher() as out:
+                            chunks = client.stream_task(message, mode=state.mode, system_prompt=state.system_prompt)
+                            for chunk in _read_ahead(chunks, out.flush, out.flush_interval):
+                                out.write(chunk)
+                                parts.append(chunk)
                         
-                        console.print()
-                        messages.append({"role": "assistant", "content": response_text})
+                        messages.append({"role": "assistant", "content": "".join(parts)})
                     else:
                         with console.status("[bold green]Manus is thinking...", spinner="dots"):
-                            response = client.create_task(message, mode=current_mode, system_prompt=system_prompt)
+                            response = client.create_task(message, mode=state.mode, system_prompt=state.system_prompt)
                         
                         console.print("\n[bold magenta]Manus:[/bold magenta]")
-                        console.print_json(data=response)
+                        _print_json(response)
                         
                         messages.append({"role": "assistant", "content": str(response)})
                         
@@ -529,8 +778,7 @@ def task(
     Example:
         manus task "Build a web scraper" --spec-driven --role developer
     """
-    # Redirect to chat command
-    chat(message=prompt, mode=mode, role=role, spec_driven=spec_driven)
+    _run_chat(prompt, mode, role, None, False, spec_driven, None)
 
 
 @app.command()
@@ -538,14 +786,16 @@ def status(
     task_id: str = typer.Argument(..., help="Task ID to check")
 ):
     """Check the status of a task"""
+    from .api_enhanced import ManusAPIError
+    
     try:
-        client = ManusClient()
+        client = _get_client()
         
         with console.status("[bold green]Fetching task status...", spinner="dots"):
             response = client.get_task_status(task_id)
         
         console.print(f"\n[bold]Task Status:[/bold]")
-        console.print_json(data=response)
+        _print_json(response)
         
     except ManusAPIError as e:
         console.print(f"[red]Error: {e}[/red]")
@@ -555,8 +805,10 @@ def status(
 @app.command()
 def history():
     """List saved conversation history"""
+    from rich.table import Table
+    
     try:
-        client = ManusClient()
+        client = _get_client()
         conversations = client.list_conversations()
         
         if not conversations:
@@ -570,11 +822,11 @@ def history():
         table.add_column("Date", style="green")
         table.add_column("Messages", style="white")
         
+        # time.strftime on the epoch value avoids a datetime object per row
         for conv in conversations:
-            timestamp = datetime.fromtimestamp(conv["timestamp"])
             table.add_row(
                 conv["id"][:16] + "...",
-                timestamp.strftime("%Y-%m-%d %H:%M"),
+                time.strftime("%Y-%m-%d %H:%M", time.localtime(conv["timestamp"])),
                 str(conv["message_count"])
             )
         
@@ -3,45 +3,47 @@ Manus CLI v4.0 - Complete Spec-Kit Integration
 Professional CLI with GitHub Spec-Kit methodology
 """
 
+import functools
 import os
 import sys
-import json
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional, TYPE_CHECKING
 from typing_extensions import Annotated
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.prompt import Prompt, Confirm
-
-# Import from existing modules
-from .api_enhanced import ManusClient
-from .roles import ROLES, get_system_prompt
-from .speckit import (
-    SpecKitEngine,
-    should_use_spec_driven,
-    assess_complexity,
-    ConstitutionPhase,
-    SpecificationPhase,
-    PlanningPhase,
-)
-from .updater import check_for_updates
+from rich.console import Console, Group
+
+from . import __version__, fastjson
+from .fileutils import atomic_write, read_json, tail_lines
+
+if TYPE_CHECKING:
+    from .api_enhanced import ManusClient
+
+# The API client (and requests with it), roles, Spec-Kit phases, updater
+# and Rich widgets are imported inside the functions that use them, so
+# trivial invocations like `manus --version` only load typer and the console
 
 app = typer.Typer(help="Manus CLI v5.3 - Spec-Driven Development")
 console = Console()
 
-# Version
-from . import __version__
+def _print_version():
+    """Print the one-line version banner."""
+    console.print(f"[bold green]Manus CLI v{__version__}[/bold green]")
+
 
 def version_callback(value: bool):
     """Callback for --version flag."""
     if value:
-        console.print(f"[bold green]Manus CLI v{__version__}[/bold green]")
+        _print_version()
         raise typer.Exit()
 
+# Commands that talk to the API in a user's terminal session; only these
+# are worth an update check (`update` does its own)
+_UPDATE_CHECK_COMMANDS = frozenset({"chat", "start", "task"})
+
 @app.callback()
 def main(
+    ctx: typer.Context,
     version: Annotated[
         Optional[bool],
         typer.Option(
@@ -53,53 +55,132 @@ def main(
     ] = None,
 ):
     """Manus CLI - Professional AI Agent Command-Line Interface with Spec-Driven Development."""
-    # Check for updates (non-blocking, once per day)
+    # Check for updates (non-blocking, once per day), but not for quick
+    # lookups or when output is piped
+    if ctx.invoked_subcommand not in _UPDATE_CHECK_COMMANDS or not console.is_terminal:
+        return
+    
     try:
+        from .updater import check_for_updates
         check_for_updates(silent=False)
     except Exception:
         # Silently ignore update check failures
         pass
 
 # Configuration
-CONFIG_DIR = Path.home() / ".config" / "manus"
-CONFIG_FILE = CONFIG_DIR / "config.json"
-HISTORY_FILE = CONFIG_DIR / "history.json"
-TEMPLATES_DIR = Path(__file__).parent / "templates"
+CONFIG_FILENAME = "config.json"
+HISTORY_FILENAME = "history.json"
+# Append-only log, one JSON entry per line; preferred over HISTORY_FILENAME
+HISTORY_LOG_FILENAME = "history.jsonl"
+
+
+# Directories are resolved on first use, not at import, so commands that
+# never touch them (--version, roles) don't pay for it
+@functools.lru_cache(maxsize=1)
+def _config_dir() -> Path:
+    return Path.home() / ".config" / "manus"
+
+
+@functools.lru_cache(maxsize=1)
+def _templates_dir() -> Path:
+    return Path(__file__).parent / "templates"
+
+
+def _load_json(path: Path):
+    """Load a JSON file through the cache, or None if it does not exist."""
+    try:
+        return read_json(path)
+    except FileNotFoundError:
+        return None
 
 
 def load_config() -> dict:
     """Load configuration from file."""
-    if not CONFIG_FILE.exists():
-        return {}
-    
-    with open(CONFIG_FILE, "r") as f:
-        return json.load(f)
+    config = _load_json(_config_dir() / CONFIG_FILENAME)
+    return config if config is not None else {}
+
+
+@functools.lru_cache(maxsize=1)
+def _ensure_config_dir() -> None:
+    """Create the config directory once per process."""
+    _config_dir().mkdir(parents=True, exist_ok=True)
 
 
 def save_config(config: dict):
     """Save configuration to file."""
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(config, f, indent=2)
+    _ensure_config_dir()
+    # The file holds the API key, so it is never readable by others, and
+    # the atomic rename means a crash can't leave a truncated config
+    atomic_write(_config_dir() / CONFIG_FILENAME, fastjson.dumps(config, indent=True), mode=0o600)
 
 
-def get_api_client() -> Optional[ManusClient]:
-    """Get configured API client with CLI session ID."""
+def get_api_client(config: Optional[dict] = None) -> Optional["ManusClient"]:
+    """Get configured API client with CLI session ID (config is loaded if not given)."""
+    from .api_enhanced import ManusClient
     from .session import get_cli_session_id
     
-    config = load_config()
+    if config is None:
+        config = load_config()
     api_key = config.get("api_key")
     
     if not api_key:
         console.print("[red]Error:[/red] API key not configured. Run [cyan]manus configure[/cyan] first.")
         return None
     
-    # Get or create CLI session ID (separate from Web)
+    # Get or create CLI session ID (separate from Web); only reached once
+    # the cheap API key check has passed, since it may write the session file
     session_id = get_cli_session_id()
     
     return ManusClient(api_key=api_key, session_id=session_id)
 
 
+_VALID_MODES = frozenset({"speed", "balanced", "quality"})
+
+
+# (label, key, default) for the plain settings shown by configure
+_CONFIG_ROWS = (
+    ("Default Mode", "default_mode", "quality"),
+    ("Default Role", "default_role", "assistant"),
+    ("Streaming", "streaming", True),
+)
+
+# (label, key) for the session info table
+_SESSION_ROWS = (
+    ("Session ID", "session_id"),
+    ("Created At", "created_at"),
+    ("Source", "source"),
+)
+
+
+def _config_rows(config: dict):
+    """Yield (setting, value) display pairs for a configuration."""
+    api_key = config.get("api_key")
+    yield "API Key", "***" + api_key[-8:] if api_key else "Not set"
+    for label, key, default in _CONFIG_ROWS:
+        yield label, str(config.get(key, default))
+    yield "Spec-Driven", str(config.get("spec_driven", {}).get("enabled", True))
+
+
+def _print_config_table(config: dict, title: str, lead: Iterable = ()):
+    """Show a configuration as a table, or as plain lines when output is piped.
+    
+    Lines in lead are printed above it in the same write.
+    """
+    if not console.is_terminal:
+        console.print(Group(*lead))
+        typer.echo("\n".join(f"{setting}: {value}" for setting, value in _config_rows(config)))
+        return
+    
+    from rich.table import Table
+    
+    table = Table(title=title)
+    table.add_column("Setting", style="cyan")
+    table.add_column("Value", style="white")
+    for setting, value in _config_rows(config):
+        table.add_row(setting, value)
+    console.print(Group(*lead, table))
+
+
 @app.command()
 def configure(
     api_key: str = typer.Option(None, "--api-key", help="Manus API key"),
@@ -116,6 +197,8 @@ def configure(
         manus configure --mode quality --role developer
         manus configure --show
     """
+    from .roles import ROLES
+    
     config = load_config()
     
     # If --show flag, just display config and exit
@@ -124,17 +207,7 @@ def configure(
             console.print("[yellow]No configuration found. Run 'manus configure --api-key YOUR_KEY' to get started.[/yellow]")
             return
         
-        table = Table(title="Current Configuration")
-        table.add_column("Setting", style="cyan")
-        table.add_column("Value", style="white")
-        
-        table.add_row("API Key", "***" + config.get("api_key", "")[-8:] if config.get("api_key") else "Not set")
-        table.add_row("Default Mode", config.get("default_mode", "quality"))
-        table.add_row("Default Role", config.get("default_role", "assistant"))
-        table.add_row("Streaming", str(config.get("streaming", True)))
-        table.add_row("Spec-Driven", str(config.get("spec_driven", {}).get("enabled", True)))
-        
-        console.print(table)
+        _print_config_table(config, "Current Configuration")
         return
     
     # If no options provided, show help
@@ -142,28 +215,29 @@ def configure(
         console.print("[yellow]No options provided. Use --help to see available options or --show to view current config.[/yellow]")
         return
     
-    # Update config
+    # Update config; the confirmations are printed together with the table
+    notes = []
     if api_key:
         config["api_key"] = api_key
-        console.print("[green]✓[/green] API key configured")
+        notes.append("[green]✓[/green] API key configured")
     
     if mode:
-        if mode not in ["speed", "balanced", "quality"]:
+        if mode not in _VALID_MODES:
             console.print("[red]Error:[/red] Mode must be one of: speed, balanced, quality")
             raise typer.Exit(1)
         config["default_mode"] = mode
-        console.print(f"[green]✓[/green] Default mode set to {mode}")
+        notes.append(f"[green]✓[/green] Default mode set to {mode}")
     
     if role:
         if role not in ROLES:
             console.print(f"[red]Error:[/red] Invalid role. Run 'manus roles' to see available roles.")
             raise typer.Exit(1)
         config["default_role"] = role
-        console.print(f"[green]✓[/green] Default role set to {role}")
+        notes.append(f"[green]✓[/green] Default role set to {role}")
     
     if streaming is not None:
         config["streaming"] = streaming
-        console.print(f"[green]✓[/green] Streaming {'enabled' if streaming else 'disabled'}")
+        notes.append(f"[green]✓[/green] Streaming {'enabled' if streaming else 'disabled'}")
     
     # Spec-Driven defaults
     if "spec_driven" not in config:
@@ -177,21 +251,10 @@ def configure(
         }
     
     save_config(config)
-    console.print("[green]✓[/green] Configuration saved")
+    notes += ["[green]✓[/green] Configuration saved", ""]
     
     # Show updated config
-    console.print()
-    table = Table(title="Updated Configuration")
-    table.add_column("Setting", style="cyan")
-    table.add_column("Value", style="white")
-    
-    table.add_row("API Key", "***" + config.get("api_key", "")[-8:] if config.get("api_key") else "Not set")
-    table.add_row("Default Mode", config.get("default_mode", "quality"))
-    table.add_row("Default Role", config.get("default_role", "assistant"))
-    table.add_row("Streaming", str(config.get("streaming", True)))
-    table.add_row("Spec-Driven", str(config.get("spec_driven", {}).get("enabled", True)))
-    
-    console.print(table)
+    _print_config_table(config, "Updated Configuration", notes)
 
 
 @app.command()
@@ -199,6 +262,9 @@ def roles():
     """
     List all available roles.
     """
+    from rich.table import Table
+    from .roles import ROLES
+    
     table = Table(title="Available Roles")
     table.add_column("Role", style="cyan")
     table.add_column("Description", style="white")
@@ -209,6 +275,41 @@ def roles():
     console.print(table)
 
 
+def _write_stream(chunks: Iterable[str], flush_interval: float = 0.05, max_chars: int = 4096):
+    """
+    Write streamed chunks to the console's file in batches.
+    
+    Chunks are plain model text, so they skip console.print. On a terminal
+    the batch is written on newlines, every flush_interval seconds or once
+    it holds max_chars characters; when output is piped it is written once
+    at the end.
+    """
+    out = console.file
+    if not console.is_terminal:
+        out.write("".join(chunks))
+        out.flush()
+        return
+    
+    buffer = []
+    size = 0
+    monotonic = time.monotonic
+    last_flush = monotonic()
+    
+    for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk)
+        now = monotonic()
+        if size >= max_chars or "\n" in chunk or now - last_flush >= flush_interval:
+            out.write("".join(buffer))
+            out.flush()
+            buffer.clear()
+            size = 0
+            last_flush = now
+    
+    out.write("".join(buffer))
+    out.flush()
+
+
 @app.command()
 def chat(
     message: str = typer.Argument(None, help="Message to send (optional in interactive mode)"),
@@ -216,6 +317,8 @@ def chat(
     mode: str = typer.Option(None, "--mode", "-m", help="Mode (speed/balanced/quality)"),
     interactive: bool = typer.Option(False, "--interactive", "-i", help="Start interactive mode"),
     no_spec_driven: bool = typer.Option(False, "--no-spec-driven", help="Disable spec-driven mode"),
+    no_splash: bool = typer.Option(False, "--no-splash", help="Skip the splash screen in interactive mode"),
+    strict_validation: bool = typer.Option(False, "--strict-validation", help="Validate generated spec-driven artifacts"),
 ):
     """
     Send a message to Manus AI.
@@ -226,28 +329,36 @@ def chat(
         manus chat "Build a REST API" --mode quality
         manus chat -i  # Interactive mode
     """
-    # Get API client
-    client = get_api_client()
-    if not client:
+    from .roles import get_system_prompt
+    from .speckit import should_use_spec_driven
+    
+    interactive = interactive or message is None
+    
+    # Validate message for non-interactive mode before any setup
+    if not interactive and not message:
+        console.print("[red]Error:[/red] MESSAGE is required (or use -i for interactive mode)")
         raise typer.Exit(1)
     
-    # Load config
+    # Load config once; the client reads its API key from the same dict
     config = load_config()
     
+    # Get API client
+    client = get_api_client(config)
+    if not client:
+        raise typer.Exit(1)
+    
     # Determine role and mode
     role = role or config.get("default_role", "assistant")
     mode = mode or config.get("default_mode", "quality")
     
     # Handle interactive mode
-    if interactive or message is None:
-        run_interactive_chat(client, role, mode, config, no_spec_driven)
+    if interactive:
+        run_interactive_chat(
+            client, role, mode, config, no_spec_driven,
+            splash=not no_splash, strict_validation=strict_validation
+        )
         return
     
-    # Validate message for non-interactive mode
-    if not message:
-        console.print("[red]Error:[/red] MESSAGE is required (or use -i for interactive mode)")
-        raise typer.Exit(1)
-    
     # Check if spec-driven mode should be used
     spec_driven_config = config.get("spec_driven", {})
     use_spec_driven = (
@@ -261,7 +372,8 @@ def chat(
         
         if should_use:
             # Run spec-driven workflow
-            run_spec_driven_workflow(message, role, mode, complexity, client)
+            strict_validation = strict_validation or spec_driven_config.get("strict_validation", False)
+            run_spec_driven_workflow(message, role, mode, complexity, client, strict_validation)
             return
     
     # Regular chat mode
@@ -270,8 +382,7 @@ def chat(
     try:
         if config.get("streaming", True):
             console.print(f"[bold cyan]{role.title()}:[/bold cyan]", end=" ")
-            for chunk in client.stream_task(message, system_prompt=system_prompt, mode=mode):
-                console.print(chunk, end="")
+            _write_stream(client.stream_task(message, system_prompt=system_prompt, mode=mode))
             console.print()  # New line after streaming
         else:
             response_text = client.chat(message, system_prompt=system_prompt, mode=mode)
@@ -282,12 +393,29 @@ def chat(
         raise typer.Exit(1)
 
 
+# (colour, plain) prompt pairs, pre-rendered to match the Prompt.ask calls
+# they replace so no Rich rendering happens per input line. Escapes are
+# wrapped in \001/\002 so readline doesn't count them in the prompt width
+_YOU_PROMPT = ("\001\x1b[1;32m\002You\001\x1b[0m\002: ", "You: ")
+_PROJECT_NAME_PROMPT = (
+    "\001\x1b[36m\002Project name\001\x1b[0m\002 \001\x1b[1;36m\002(my-project)\001\x1b[0m\002: ",
+    "Project name (my-project): "
+)
+
+
+def _ask(color_prompt: str, plain_prompt: str) -> str:
+    """Read a line with input(), using the coloured prompt only on a colour terminal."""
+    return input(color_prompt if console.is_terminal and console.color_system else plain_prompt)
+
+
 def run_interactive_chat(
-    client: ManusClient,
+    client: "ManusClient",
     role: str,
     mode: str,
     config: dict,
-    no_spec_driven: bool
+    no_spec_driven: bool,
+    splash: bool = True,
+    strict_validation: bool = False
 ):
     """
     Run interactive chat session.
@@ -298,20 +426,39 @@ def run_interactive_chat(
         mode: Execution mode
         config: Configuration dict
         no_spec_driven: Whether to disable spec-driven mode
+        splash: Whether to show the splash screen (only ever shown on a
+            terminal, and never when MANUS_NO_SPLASH is set)
+        strict_validation: Validate spec-driven artifacts (also enabled by
+            the spec_driven.strict_validation config setting)
     """
-    from .splash import show_interactive_splash
+    from .roles import get_system_prompt
+    from .speckit import should_use_spec_driven
     
     # Show splash screen
-    show_interactive_splash()
+    if splash and console.is_terminal and not os.environ.get("MANUS_NO_SPLASH"):
+        from .splash import show_interactive_splash
+        show_interactive_splash()
     
-    # Get system prompt
-    system_prompt = get_system_prompt(role)
+    # Only regular chat turns need the system prompt; it is looked up on the
+    # first one
+    system_prompt = None
+    
+    # Settings are fixed for the session, so resolve them once
+    spec_driven_config = config.get("spec_driven", {})
+    use_spec_driven = (
+        spec_driven_config.get("enabled", True) and
+        spec_driven_config.get("auto_detect", True) and
+        not no_spec_driven
+    )
+    strict_validation = strict_validation or spec_driven_config.get("strict_validation", False)
+    streaming = config.get("streaming", True)
+    role_prefix = f"[bold cyan]{role.title()}:[/bold cyan] "
     
     # Interactive loop
     while True:
         try:
             # Get user input
-            user_input = Prompt.ask("[bold green]You[/bold green]")
+            user_input = _ask(*_YOU_PROMPT)
             
             # Check for exit commands
             if user_input.lower() in ["exit", "quit", "q", "bye"]:
@@ -323,31 +470,26 @@ def run_interactive_chat(
                 continue
             
             # Check if spec-driven mode should be used
-            spec_driven_config = config.get("spec_driven", {})
-            use_spec_driven = (
-                spec_driven_config.get("enabled", True) and
-                spec_driven_config.get("auto_detect", True) and
-                not no_spec_driven
-            )
-            
             if use_spec_driven:
                 should_use, complexity = should_use_spec_driven(user_input)
                 
                 if should_use:
                     # Run spec-driven workflow
-                    run_spec_driven_workflow(user_input, role, mode, complexity, client)
+                    run_spec_driven_workflow(user_input, role, mode, complexity, client, strict_validation)
                     continue
             
             # Regular chat
+            if system_prompt is None:
+                system_prompt = get_system_prompt(role)
+            
             console.print()
-            if config.get("streaming", True):
-                console.print(f"[bold cyan]{role.title()}:[/bold cyan] ", end="")
-                for chunk in client.stream_task(user_input, system_prompt=system_prompt, mode=mode):
-                    console.print(chunk, end="")
+            if streaming:
+                console.print(role_prefix, end="")
+                _write_stream(client.stream_task(user_input, system_prompt=system_prompt, mode=mode))
                 console.print("\n")  # New line after streaming
             else:
                 response_text = client.chat(user_input, system_prompt=system_prompt, mode=mode)
-                console.print(f"[bold cyan]{role.title()}:[/bold cyan] {response_text}\n")
+                console.print(f"{role_prefix}{response_text}\n")
         
         except KeyboardInterrupt:
             console.print("\n\n[cyan]👋 Goodbye![/cyan]\n")
@@ -362,7 +504,8 @@ def run_spec_driven_workflow(
     role: str,
     mode: str,
     complexity: str,
-    client: ManusClient
+    client: "ManusClient",
+    strict_validation: bool = False
 ):
     """
     Run the complete spec-driven workflow.
@@ -373,22 +516,32 @@ def run_spec_driven_workflow(
         mode: Execution mode
         complexity: Complexity level (simple/moderate/complex)
         client: API client
+        strict_validation: Validate each generated artifact and print warnings
     """
+    from rich.table import Table
+    from .speckit import (
+        SpecKitEngine,
+        ConstitutionPhase,
+        SpecificationPhase,
+        PlanningPhase,
+    )
+    
     # Initialize Spec-Kit engine
     engine = SpecKitEngine()
+    templates_dir = _templates_dir()
     
     # Show splash screen
     engine.show_splash_screen(mode, role, complexity)
     
     # Extract project info from message
-    project_name = Prompt.ask("[cyan]Project name[/cyan]", default="my-project")
+    project_name = _ask(*_PROJECT_NAME_PROMPT).strip() or "my-project"
     
     # Phase 1: Constitution
     engine.show_phase_header(1, "Constitution", total_phases=3)
     
     constitution_phase = ConstitutionPhase(
         memory_dir=engine.memory_dir,
-        templates_dir=TEMPLATES_DIR
+        templates_dir=templates_dir
     )
     
     success, constitution_path = constitution_phase.execute(
@@ -400,12 +553,14 @@ def run_spec_driven_workflow(
         console.print("[red]✗[/red] Constitution phase failed")
         raise typer.Exit(1)
     
-    # Validate constitution
-    is_valid, errors = constitution_phase.validate(constitution_path)
-    if not is_valid:
-        console.print("[yellow]⚠[/yellow] Constitution validation warnings:")
-        for error in errors:
-            console.print(f"  • {error}")
+    # Validate constitution; the checks only produce warnings, so the
+    # artifacts are re-read for them only when asked to
+    if strict_validation:
+        is_valid, errors = constitution_phase.validate(constitution_path)
+        if not is_valid:
+            console.print("[yellow]⚠[/yellow] Constitution validation warnings:")
+            for error in errors:
+                console.print(f"  • {error}")
     
     # Phase 2: Specification
     engine.show_phase_header(2, "Specification", total_phases=3)
@@ -416,7 +571,7 @@ def run_spec_driven_workflow(
     
     specification_phase = SpecificationPhase(
         specs_dir=engine.specs_dir,
-        templates_dir=TEMPLATES_DIR
+        templates_dir=templates_dir
     )
     
     success, feature_dir, metadata = specification_phase.execute(
@@ -435,16 +590,17 @@ def run_spec_driven_workflow(
     
     # Validate specification
     spec_file = feature_dir / "spec.md"
-    is_valid, errors = specification_phase.validate(spec_file)
-    if not is_valid:
-        console.print("[yellow]⚠[/yellow] Specification validation warnings:")
-        for error in errors:
-            console.print(f"  • {error}")
+    if strict_validation:
+        is_valid, errors = specification_phase.validate(spec_file)
+        if not is_valid:
+            console.print("[yellow]⚠[/yellow] Specification validation warnings:")
+            for error in errors:
+                console.print(f"  • {error}")
     
     # Phase 3: Planning
     engine.show_phase_header(3, "Planning", total_phases=3)
     
-    planning_phase = PlanningPhase(templates_dir=TEMPLATES_DIR)
+    planning_phase = PlanningPhase(templates_dir=templates_dir)
     
     success, plan_file = planning_phase.execute(
         feature_dir=feature_dir,
@@ -458,11 +614,12 @@ def run_spec_driven_workflow(
         raise typer.Exit(1)
     
     # Validate plan
-    is_valid, errors = planning_phase.validate(plan_file, spec_file)
-    if not is_valid:
-        console.print("[yellow]⚠[/yellow] Plan validation warnings:")
-        for error in errors:
-            console.print(f"  • {error}")
+    if strict_validation:
+        is_valid, errors = planning_phase.validate(plan_file, spec_file)
+        if not is_valid:
+            console.print("[yellow]⚠[/yellow] Plan validation warnings:")
+            for error in errors:
+                console.print(f"  • {error}")
     
     # Summary
     console.print()
@@ -502,7 +659,10 @@ def task(
     console.print()
     
     # Fallback to chat
-    chat(message=message, mode=mode, interactive=False, no_spec_driven=True)
+    chat(
+        message=message, role=None, mode=mode, interactive=False,
+        no_spec_driven=True, no_splash=True, strict_validation=False
+    )
 
 
 @app.command()
@@ -513,36 +673,54 @@ def history(
     """
     View or clear conversation history.
     """
+    config_dir = _config_dir()
+    
     if clear:
-        if HISTORY_FILE.exists():
-            HISTORY_FILE.unlink()
+        cleared = False
+        for path in (config_dir / HISTORY_LOG_FILENAME, config_dir / HISTORY_FILENAME):
+            try:
+                path.unlink()
+                cleared = True
+            except FileNotFoundError:
+                pass
+        if cleared:
             console.print("[green]✓[/green] History cleared")
         else:
             console.print("[yellow]No history to clear[/yellow]")
         return
     
-    if not HISTORY_FILE.exists():
-        console.print("[yellow]No history found[/yellow]")
-        return
-    
-    with open(HISTORY_FILE, "r") as f:
-        history_data = json.load(f)
-    
-    entries = history_data.get("entries", [])[-limit:]
+    log_path = config_dir / HISTORY_LOG_FILENAME
+    if log_path.exists():
+        # Only the requested tail of the log is read and parsed
+        entries = []
+        for line in tail_lines(log_path, limit, block_size=65536):
+            try:
+                entries.append(fastjson.loads(line))
+            except fastjson.JSONDecodeError:
+                # A line cut short by an interrupted write
+                continue
+    else:
+        history_data = _load_json(config_dir / HISTORY_FILENAME)
+        if history_data is None:
+            console.print("[yellow]No history found[/yellow]")
+            return
+        entries = history_data.get("entries", [])[-limit:]
     
     if not entries:
         console.print("[yellow]No history entries[/yellow]")
         return
     
-    console.print(f"[bold]Last {len(entries)} entries:[/bold]")
-    console.print()
+    lines = [f"[bold]Last {len(entries)} entries:[/bold]", ""]
     
     for entry in entries:
         timestamp = entry.get("timestamp", "unknown")
         role = entry.get("role", "unknown")
         message = entry.get("message", "")
         
-        console.print(f"[dim]{timestamp}[/dim] [cyan]{role}:[/cyan] {message[:100]}...")
+        lines.append(f"[dim]{timestamp}[/dim] [cyan]{role}:[/cyan] {message[:100]}...")
+    
+    # One render and write for the whole listing
+    console.print(Group(*lines))
 
 
 @app.command()
@@ -558,6 +736,7 @@ def session(
         manus session --new    # Start a new session
         manus session --clear  # Clear current session
     """
+    from rich.table import Table
     from .session import session_manager
     
     if clear:
@@ -580,9 +759,8 @@ def session(
     table.add_column("Property", style="cyan")
     table.add_column("Value", style="white")
     
-    table.add_row("Session ID", info.get("session_id", "N/A"))
-    table.add_row("Created At", info.get("created_at", "N/A"))
-    table.add_row("Source", info.get("source", "N/A"))
+    for label, key in _SESSION_ROWS:
+        table.add_row(label, info.get(key, "N/A"))
     
     console.print(table)
     console.print("\n[dim]Note: CLI sessions are separate from Web interface sessions[/dim]")
@@ -593,7 +771,7 @@ def version():
     """
     Show version information.
     """
-    from . import __version__
+    from rich.table import Table
     
     table = Table(title="Manus CLI")
     table.add_column("Component", style="cyan")
@@ -610,6 +788,7 @@ def version():
 def start(
     role: str = typer.Option(None, "--role", "-r", help="Role to use"),
     mode: str = typer.Option(None, "--mode", "-m", help="Mode (speed/balanced/quality)"),
+    no_splash: bool = typer.Option(False, "--no-splash", help="Skip the splash screen"),
 ):
     """
     Start Manus CLI with interactive splash screen.
@@ -617,20 +796,20 @@ def start(
     This command displays the beautiful 'AND AFTER YOU' splash screen
     and enters interactive mode, making it clear that you can start chatting.
     """
+    # Load config once; the client reads its API key from the same dict
+    config = load_config()
+    
     # Get API client
-    client = get_api_client()
+    client = get_api_client(config)
     if not client:
         raise typer.Exit(1)
     
-    # Load config
-    config = load_config()
-    
     # Determine role and mode
     role = role or config.get("default_role", "assistant")
     mode = mode or config.get("default_mode", "quality")
     
     # Run interactive chat with splash
-    run_interactive_chat(client, role, mode, config, no_spec_driven=False)
+    run_interactive_chat(client, role, mode, config, no_spec_driven=False, splash=not no_splash)
 
 
 @app.command()
@@ -650,8 +829,26 @@ def update():
         raise typer.Exit(1)
 
 
+def _show_config():
+    configure(api_key=None, mode=None, role=None, streaming=None, show=True)
+
+
+# Exact argument lists that need no parsing are answered directly, without
+# typer building its command tree; anything else goes through the full CLI
+_FAST_COMMANDS = {
+    ("--version",): _print_version,
+    ("-v",): _print_version,
+    ("roles",): roles,
+    ("configure", "--show"): _show_config,
+}
+
+
 def main():
     """Main entry point."""
+    fast_command = _FAST_COMMANDS.get(tuple(sys.argv[1:]))
+    if fast_command is not None:
+        fast_command()
+        return
     app()
 
 
@@ -1,59 +1,126 @@
 """Multi-turn Conversation Context for Manus CLI v5.2"""
-import json
+import time
+from collections import deque
 from pathlib import Path
-from typing import List, Dict, Optional
-from dataclasses import dataclass, asdict
+from typing import Deque, List, Dict, Optional
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
 
+from .. import fastjson
+from ..fileutils import atomic_write, tail_lines
+
 @dataclass
 class Message:
     role: str  # 'user' or 'assistant'
     content: str
-    timestamp: str = None
-    
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now().isoformat()
+    timestamp: float = field(default_factory=time.time)  # seconds since the epoch
+
+def _message_record(record: dict) -> dict:
+    """Returns a stored message with its timestamp as seconds since the epoch."""
+    timestamp = record.get("timestamp")
+    if isinstance(timestamp, str):
+        # Sessions saved as .json used ISO strings
+        record["timestamp"] = datetime.fromisoformat(timestamp).timestamp()
+    return record
 
 class ConversationContext:
-    """Manages multi-turn conversation context."""
+    """Manages multi-turn conversation context.
+    
+    Each session is an append-only JSONL log, one message per line, so
+    adding a message writes only that line instead of the whole window.
+    Once the log holds twice the window it is rewritten with just the
+    window, so it never grows without bound.
+    """
     
     def __init__(self, session_id: Optional[str] = None, max_messages: int = 20):
         self.session_id = session_id or datetime.now().strftime("%Y%m%d_%H%M%S")
         self.max_messages = max_messages
-        self.messages: List[Message] = []
+        # Bounded window: appending past max_messages drops the oldest
+        self.messages: Deque[Message] = deque(maxlen=max_messages)
         self.context_dir = Path.home() / ".manus" / "conversations"
         self.context_dir.mkdir(parents=True, exist_ok=True)
+        self._log = None
+        # Lines known to be in the session log, to decide when to compact it
+        self._log_lines = 0
+    
+    def _log_path(self, session_id: str) -> Path:
+        return self.context_dir / f"{session_id}.jsonl"
+    
+    def _append(self, msg: Message):
+        """Appends one message to the session log."""
+        path = self._log_path(self.session_id)
+        # Opened lazily so context_dir/session_id can change before first use
+        if self._log is None or self._log.name != str(path):
+            self.close()
+            self._log = open(path, "ab")
+        self._log.write(fastjson.dumps(asdict(msg)) + b"\n")
+        # Flushed per message so the log is always readable by other sessions
+        self._log.flush()
+        self._log_lines += 1
+        if self._log_lines >= 2 * self.max_messages:
+            self.save()
     
     def add_message(self, role: str, content: str):
         """Adds a message to the conversation."""
-        self.messages.append(Message(role=role, content=content))
-        if len(self.messages) > self.max_messages:
-            self.messages = self.messages[-self.max_messages:]
-        self.save()
+        msg = Message(role=role, content=content)
+        self.messages.append(msg)
+        self._append(msg)
     
     def get_context(self) -> List[Dict[str, str]]:
         """Returns conversation context for API calls."""
         return [{"role": msg.role, "content": msg.content} for msg in self.messages]
     
     def save(self):
-        """Saves conversation to disk."""
-        file_path = self.context_dir / f"{self.session_id}.json"
-        file_path.write_text(json.dumps([asdict(msg) for msg in self.messages], indent=2))
+        """Rewrites the session log with just the current window of messages."""
+        self.close()
+        data = b"".join(fastjson.dumps(asdict(msg)) + b"\n" for msg in self.messages)
+        atomic_write(self._log_path(self.session_id), data, durable=False)
+        self._log_lines = len(self.messages)
     
     def load(self, session_id: str):
         """Loads conversation from disk."""
-        file_path = self.context_dir / f"{session_id}.json"
+        file_path = self._log_path(session_id)
         if file_path.exists():
-            data = json.loads(file_path.read_text())
-            self.messages = [Message(**msg) for msg in data]
-            self.session_id = session_id
+            # Only the window at the end of the log is read
+            data = []
+            for line in tail_lines(file_path, self.max_messages):
+                try:
+                    data.append(_message_record(fastjson.loads(line)))
+                except fastjson.JSONDecodeError:
+                    # A line cut short by an interrupted write
+                    continue
+        else:
+            # Sessions saved before the log format are a single JSON array
+            legacy_path = self.context_dir / f"{session_id}.json"
+            if not legacy_path.exists():
+                return
+            data = [_message_record(record) for record in fastjson.loads(legacy_path.read_bytes())]
+            # Move the session into the log first, otherwise the next
+            # add_message would start a log that hides the legacy history
+            atomic_write(
+                file_path, b"".join(fastjson.dumps(msg) + b"\n" for msg in data), durable=False
+            )
+        
+        self.close()
+        self.messages = deque(
+            (Message(**msg) for msg in data[-self.max_messages:]), maxlen=self.max_messages
+        )
+        self.session_id = session_id
+        self._log_lines = len(data)
     
     def list_sessions(self) -> List[str]:
         """Lists all saved conversation sessions."""
-        return [f.stem for f in self.context_dir.glob("*.json")]
+        sessions = {f.stem for f in self.context_dir.glob("*.jsonl")}
+        sessions.update(f.stem for f in self.context_dir.glob("*.json"))
+        return sorted(sessions)
     
     def clear(self):
         """Clears current conversation."""
-        self.messages = []
+        self.messages.clear()
         self.save()
+    
+    def close(self):
+        """Closes the session log; it is reopened on the next message."""
+        if self._log is not None:
+            self._log.close()
+            self._log = None
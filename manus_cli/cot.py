@@ -14,6 +14,24 @@ from rich.panel import Panel
 
 console = Console()
 
+_THINKING_RE = re.compile(r"<thinking>(.*?)</thinking>", re.DOTALL | re.IGNORECASE)
+_ANSWER_RE = re.compile(r"<answer>(.*?)</answer>", re.DOTALL | re.IGNORECASE)
+
+# Keywords that trigger CoT
+_COT_TRIGGERS = frozenset({
+    "create", "build", "plan", "design", "architect",
+    "analyze", "evaluate", "compare", "debug",
+    "refactor", "optimize", "review", "implement"
+})
+
+# Spec-driven keywords
+_SPEC_KEYWORDS = frozenset({"specification", "requirements", "architecture", "system design"})
+
+
+def _scan_input(text: str) -> Tuple[int, int, str]:
+    """Returns (word_count, question_count, lowercased text) for the heuristics."""
+    return len(text.split()), text.count("?"), text.lower()
+
 
 class ChainOfThought:
     """Implements structured Chain-of-Thought prompting."""
@@ -28,6 +46,17 @@ class ChainOfThought:
         """
         self.enabled = enabled
         self.verbose = verbose
+        # (text, scan) of the last input, shared by the heuristics below
+        self._last_scan: Optional[Tuple[str, Tuple[int, int, str]]] = None
+    
+    def _scan(self, user_input: str) -> Tuple[int, int, str]:
+        """Scans user_input, reusing the last scan if asked about the same text."""
+        last = self._last_scan
+        if last is not None and last[0] == user_input:
+            return last[1]
+        scan = _scan_input(user_input)
+        self._last_scan = (user_input, scan)
+        return scan
     
     def wrap_prompt(self, user_input: str, task_complexity: str = "medium") -> str:
         """
@@ -80,18 +109,10 @@ User Request: {user_input}
             Tuple of (thinking_process, final_answer)
         """
         # Extract thinking block
-        thinking_match = re.search(
-            r"<thinking>(.*?)</thinking>", 
-            model_output, 
-            re.DOTALL | re.IGNORECASE
-        )
+        thinking_match = _THINKING_RE.search(model_output)
         
         # Extract answer block
-        answer_match = re.search(
-            r"<answer>(.*?)</answer>", 
-            model_output, 
-            re.DOTALL | re.IGNORECASE
-        )
+        answer_match = _ANSWER_RE.search(model_output)
         
         thinking = thinking_match.group(1).strip() if thinking_match else None
         answer = answer_match.group(1).strip() if answer_match else model_output.strip()
@@ -114,27 +135,25 @@ User Request: {user_input}
         Returns:
             True if CoT should be enabled
         """
-        # Keywords that trigger CoT
-        cot_triggers = [
-            "create", "build", "plan", "design", "architect",
-            "analyze", "evaluate", "compare", "debug",
-            "refactor", "optimize", "review", "implement"
-        ]
+        return self._should_enable(command, self._scan(user_input))
+    
+    def _should_enable(self, command: str, scan: Tuple[int, int, str]) -> bool:
+        word_count, question_count, input_lower = scan
         
         # Check command
-        if any(trigger in command.lower() for trigger in cot_triggers):
+        command_lower = command.lower()
+        if any(trigger in command_lower for trigger in _COT_TRIGGERS):
             return True
         
         # Check input complexity (heuristic)
-        if len(user_input.split()) > 50:  # Long input
+        if word_count > 50:  # Long input
             return True
         
-        if "?" in user_input and user_input.count("?") > 1:  # Multiple questions
+        if question_count > 1:  # Multiple questions
             return True
         
         # Check for spec-driven keywords
-        spec_keywords = ["specification", "requirements", "architecture", "system design"]
-        if any(keyword in user_input.lower() for keyword in spec_keywords):
+        if any(keyword in input_lower for keyword in _SPEC_KEYWORDS):
             return True
         
         return False
@@ -168,8 +187,10 @@ User Request: {user_input}
         Returns:
             Complexity level: "simple", "medium", or "complex"
         """
-        word_count = len(user_input.split())
-        question_count = user_input.count("?")
+        return self._complexity(self._scan(user_input))
+    
+    def _complexity(self, scan: Tuple[int, int, str]) -> str:
+        word_count, question_count, _ = scan
         
         # Simple heuristics
         if word_count < 20 and question_count <= 1:
@@ -178,6 +199,23 @@ User Request: {user_input}
             return "complex"
         else:
             return "medium"
+    
+    def analyze(self, command: str, user_input: str) -> Tuple[bool, str]:
+        """
+        Decides whether to enable CoT and how complex the request is.
+        
+        Equivalent to should_enable_cot() plus assess_complexity(); either
+        way the input is scanned only once.
+        
+        Args:
+            command: CLI command being executed
+            user_input: User's input text
+        
+        Returns:
+            Tuple of (enable_cot, complexity)
+        """
+        scan = self._scan(user_input)
+        return self._should_enable(command, scan), self._complexity(scan)
 
 
 # Example usage
@@ -187,8 +225,9 @@ if __name__ == "__main__":
     # Test prompt
     test_prompt = "Design a microservices architecture for a real-time chat application"
     
-    # Wrap prompt
-    enhanced_prompt = cot.wrap_prompt(test_prompt, task_complexity="complex")
+    # Decide on CoT and wrap prompt
+    enable_cot, complexity = cot.analyze("plan", test_prompt)
+    enhanced_prompt = cot.wrap_prompt(test_prompt, task_complexity=complexity) if enable_cot else test_prompt
     print("Enhanced Prompt:")
     print(enhanced_prompt)
     print("\n" + "="*80 + "\n")
@@ -1,6 +1,7 @@
 """Effort Parameter module for Manus CLI v5.1"""
 from enum import Enum
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 class EffortLevel(Enum):
     LOW = "low"
@@ -34,11 +35,22 @@ class EffortManager:
     def __init__(self, effort: EffortLevel = EffortLevel.MEDIUM):
         self.effort = effort
     
-    def get_config(self) -> dict:
-        return self.EFFORT_CONFIGS[self.effort]
+    @property
+    def effort(self) -> EffortLevel:
+        return self._effort
+    
+    @effort.setter
+    def effort(self, effort: EffortLevel):
+        # The config is resolved when the level is set, not on every lookup.
+        # It is a read-only view: the dicts are shared by every manager
+        self._effort = effort
+        self._config = MappingProxyType(self.EFFORT_CONFIGS[effort])
+    
+    def get_config(self) -> Mapping:
+        return self._config
     
     def apply_to_request(self, request_params: dict) -> dict:
-        config = self.get_config()
+        config = self._config
         request_params.update({
             "max_tokens": config["max_tokens"],
             "temperature": config["temperature"]
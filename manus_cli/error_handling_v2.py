@@ -8,6 +8,8 @@ from rich.panel import Panel
 
 console = Console()
 
+_random = random.random
+
 class APIError(Exception):
     """Base exception for API errors."""
     pass
@@ -32,8 +34,8 @@ class RetryStrategy:
         self.max_delay = max_delay
     
     def get_delay(self, attempt):
-        delay = min(self.base_delay * (2 ** attempt), self.max_delay)
-        return delay * (0.75 + random.random() * 0.5)
+        delay = min(self.base_delay * (1 << attempt), self.max_delay)
+        return delay * (0.75 + _random() * 0.5)
     
     def should_retry(self, error, attempt):
         if attempt >= self.max_retries:
@@ -42,9 +44,11 @@ class RetryStrategy:
 
 def with_retry(max_retries=3, base_delay=1.0):
     def decorator(func):
+        # RetryStrategy holds no per-call state, so one instance serves every call
+        strategy = RetryStrategy(max_retries=max_retries, base_delay=base_delay)
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            strategy = RetryStrategy(max_retries=max_retries, base_delay=base_delay)
             last_error = None
             for attempt in range(max_retries + 1):
                 try:
@@ -3,7 +3,7 @@ import time
 from typing import Optional
 from typing import List, Dict, Any, Callable
 from dataclasses import dataclass, field
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 
 console = Console()
@@ -35,45 +35,61 @@ class EvaluationFramework:
         """Adds a test case."""
         self.test_cases.append(test_case)
     
-    def run_tests(self, executor: Callable[[str], str]) -> List[TestResult]:
-        """Runs all test cases."""
-        self.results = []
+    def run_tests(self, executor: Callable[[str], str], concurrency: int = 1) -> List[TestResult]:
+        """
+        Runs all test cases.
         
-        for test_case in self.test_cases:
-            console.print(f"Running: {test_case.name}...")
-            start = time.time()
-            
-            try:
-                output = executor(test_case.input)
-                duration = time.time() - start
-                
-                # Validate output
-                if test_case.validator:
-                    passed = test_case.validator(output)
-                elif test_case.expected_output:
-                    passed = output == test_case.expected_output
-                else:
-                    passed = True  # No validation
-                
-                result = TestResult(
-                    test_case=test_case,
-                    actual_output=output,
-                    passed=passed,
-                    duration=duration
-                )
-            except Exception as e:
-                result = TestResult(
-                    test_case=test_case,
-                    actual_output="",
-                    passed=False,
-                    duration=time.time() - start,
-                    error=str(e)
-                )
-            
-            self.results.append(result)
+        By default they run one by one. For a thread-safe executor (typically
+        one API call per case), pass concurrency > 1 to run up to that many
+        at once on a thread pool. Results keep the order of the test cases.
+        """
+        workers = max(1, min(concurrency, len(self.test_cases)))
+        if workers == 1:
+            self.results = [self._run_test(test_case, executor) for test_case in self.test_cases]
+            return self.results
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            self.results = list(pool.map(
+                lambda test_case: self._run_test(test_case, executor),
+                self.test_cases
+            ))
         
         return self.results
     
+    def _run_test(self, test_case: TestCase, executor: Callable[[str], str]) -> TestResult:
+        """Runs a single test case."""
+        console.print(f"Running: {test_case.name}...")
+        start = time.perf_counter()
+        
+        try:
+            output = executor(test_case.input)
+            duration = time.perf_counter() - start
+            
+            # Validate output
+            if test_case.validator:
+                passed = test_case.validator(output)
+            elif test_case.expected_output:
+                passed = output == test_case.expected_output
+            else:
+                passed = True  # No validation
+            
+            return TestResult(
+                test_case=test_case,
+                actual_output=output,
+                passed=passed,
+                duration=duration
+            )
+        except Exception as e:
+            return TestResult(
+                test_case=test_case,
+                actual_output="",
+                passed=False,
+                duration=time.perf_counter() - start,
+                error=str(e)
+            )
+    
     def print_report(self):
         """Prints test results report."""
         table = Table(title="Test Results")
@@ -92,9 +108,9 @@ class EvaluationFramework:
                 error
             )
         
-        console.print(table)
-        
         # Summary
         passed = sum(1 for r in self.results if r.passed)
         total = len(self.results)
-        console.print(f"\n[bold]Summary:[/bold] {passed}/{total} tests passed")
+        
+        # Rendered and written in one go
+        console.print(Group(table, f"\n[bold]Summary:[/bold] {passed}/{total} tests passed"))
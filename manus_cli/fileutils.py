@@ -0,0 +1,95 @@
+"""
+File helpers shared by the config, history, cache and analytics writers
+"""
+
+import os
+import copy
+import functools
+import threading
+from pathlib import Path
+from typing import Any, List, Optional
+
+from . import fastjson
+
+
+def atomic_write(
+    path: Path,
+    data: bytes,
+    mode: Optional[int] = None,
+    durable: bool = True
+) -> None:
+    """
+    Write data to path atomically.
+    
+    The bytes go to a temporary file next to the target, which is then
+    renamed over the target. Readers see either the old or the new
+    contents, never a partial write.
+    
+    Args:
+        path: Destination file
+        data: Bytes to write
+        mode: Optional permission bits for the file (e.g. 0o600)
+        durable: fsync before the rename so the new contents survive a crash
+    """
+    # One temp file per writing thread, so concurrent saves of the same
+    # path in one process never share (and truncate) each other's file
+    tmp_path = path.with_name(f"{path.name}.tmp.{os.getpid()}.{threading.get_ident()}")
+    
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666 if mode is None else mode)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            if mode is not None:
+                # os.open's mode is filtered by the umask
+                os.chmod(tmp_path, mode)
+            f.write(data)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def tail_lines(path: Path, count: int, block_size: int = 4096) -> List[bytes]:
+    """Return the last `count` non-empty lines of a file, reading backwards"""
+    if count <= 0 or not path.exists():
+        return []
+    
+    with open(path, "rb") as f:
+        f.seek(0, 2)
+        position = f.tell()
+        data = b""
+        # One newline more than count guarantees count complete lines
+        while position > 0 and data.count(b"\n") <= count:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            data = f.read(read_size) + data
+    
+    return [line for line in data.splitlines() if line.strip()][-count:]
+
+
+@functools.lru_cache(maxsize=8)
+def _read_json(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a JSON file; cached per (path, mtime, size) so edits invalidate it"""
+    with open(path, "rb") as f:
+        return fastjson.loads(f.read())
+
+
+def read_json(path: Path) -> Any:
+    """
+    Load a JSON file, parsing it again only once it has changed.
+    
+    Callers get a deep copy, so they may modify the result (nested values
+    included) without touching the cached one.
+    
+    Raises:
+        OSError: If the file can't be read (FileNotFoundError if missing)
+        json.JSONDecodeError: If the file isn't valid JSON
+    """
+    st = path.stat()
+    return copy.deepcopy(_read_json(str(path), st.st_mtime_ns, st.st_size))
@@ -2,6 +2,8 @@
 Predefined roles and system prompts for Manus CLI
 """
 
+import functools
+
 ROLES = {
     "assistant": {
         "name": "Helpful Assistant",
@@ -59,18 +61,23 @@ def get_role(role_key: str) -> dict:
     return ROLES.get(role_key, ROLES["assistant"])
 
 
+# Roles are static, so the listing is built once at import
+_ROLE_LIST = tuple(
+    {
+        "key": key,
+        "name": role["name"],
+        "description": role["system_prompt"][:100] + "..."
+    }
+    for key, role in ROLES.items()
+)
+
+
 def list_roles() -> list:
     """List all available roles"""
-    return [
-        {
-            "key": key,
-            "name": role["name"],
-            "description": role["system_prompt"][:100] + "..."
-        }
-        for key, role in ROLES.items()
-    ]
+    return list(_ROLE_LIST)
 
 
+@functools.lru_cache(maxsize=32)
 def get_system_prompt(role_key: str) -> str:
     """Get system prompt for a role"""
     role = get_role(role_key)
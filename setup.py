@@ -42,6 +42,9 @@ setup(
         "rich>=13.0.0",
         "urllib3>=1.26.0,<2.0.0",  # Pin to v1.x for macOS compatibility
     ],
+    extras_require={
+        "fast": ["orjson>=3.9.0"],  # Faster JSON (de)serialization
+    },
     entry_points={
         "console_scripts": [
             "manus=manus_cli.cli_v4:main",
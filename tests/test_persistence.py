@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Test script for Manus CLI persistence and API client behaviour
+Tests: Analytics event log, Conversation history files, Chat error paths
+"""
+
+import json
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from rich.console import Console
+from rich.panel import Panel
+
+console = Console()
+
+def test_analytics():
+    """Test Analytics event log and snapshot."""
+    console.print("\n[bold cyan]Testing Analytics Persistence...[/bold cyan]")
+    
+    from manus_cli.analytics import Analytics
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manus_dir = Path(tmpdir)
+        
+        # Test 1: Events survive a reload
+        analytics = Analytics(manus_dir)
+        analytics.track_project("demo", manus_dir / "specs")
+        analytics.track_phase_completion("demo", "specify")
+        analytics.track_quality_score("demo", 80)
+        analytics.track_tasks("demo", 10, 4)
+        analytics.close()
+        
+        reloaded = Analytics(manus_dir)
+        assert reloaded.data["total_specs"] == 1
+        assert reloaded.data["completed_tasks"] == 4
+        assert reloaded.data["projects"]["demo"]["phases_completed"] == ["specify"]
+        assert reloaded.average_quality() == 80
+        console.print("✅ Event log replay working")
+        
+        # Test 2: Crash recovery - flushed events without a snapshot,
+        # followed by a torn write
+        crashed = Analytics(manus_dir)
+        crashed.track_phase_completion("demo", "plan")
+        crashed._flush()
+        with open(manus_dir / "analytics.events.jsonl", "ab") as f:
+            f.write(b'{"seq": 99, "type": "ta')
+        
+        recovered = Analytics(manus_dir)
+        assert recovered.data["projects"]["demo"]["phases_completed"] == ["specify", "plan"]
+        crashed.close()
+        console.print("✅ Crash recovery working")
+        
+        # Test 3: Events already in the snapshot are not applied twice
+        snapshot = Analytics(manus_dir)
+        snapshot.save_analytics()
+        event_seq = snapshot.data["event_seq"]
+        snapshot.close()
+        with open(manus_dir / "analytics.events.jsonl", "ab") as f:
+            f.write(json.dumps({
+                "seq": event_seq, "type": "project", "project": "again",
+                "spec_dir": "x", "timestamp": time.time_ns()
+            }).encode() + b"\n")
+        
+        deduped = Analytics(manus_dir)
+        assert "again" not in deduped.data["projects"]
+        assert deduped.data["total_specs"] == 1
+        seqs = [event["seq"] for event in deduped.timeline]
+        assert seqs == sorted(set(seqs))
+        console.print("✅ Sequence deduplication working")
+        
+        # Test 4: Tracking after close reopens the log
+        deduped.close()
+        deduped.track_project("later", manus_dir)
+        deduped.close()
+        assert "later" in Analytics(manus_dir).data["projects"]
+        console.print("✅ Tracking after close working")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manus_dir = Path(tmpdir)
+        
+        # Test 5: The average uses each project's latest score
+        scores = Analytics(manus_dir)
+        scores.track_project("a", manus_dir)
+        scores.track_project("b", manus_dir)
+        scores.track_project("unscored", manus_dir)
+        scores.track_quality_score("a", 50)
+        scores.track_quality_score("a", 70)
+        assert scores.average_quality() == 70
+        scores.track_quality_score("b", 90)
+        assert scores.average_quality() == 80
+        scores.save_analytics()
+        scores.track_quality_score("b", 0)
+        scores.close()
+        assert Analytics(manus_dir).average_quality() == 35
+        console.print("✅ Per-project quality average working")
+        
+        # Test 6: Snapshots that summed every score are recomputed
+        legacy = json.loads((manus_dir / "analytics.json").read_text())
+        for project in legacy["projects"].values():
+            del project["quality_scored"]
+        legacy["quality_sum"], legacy["quality_count"] = 210, 3
+        (manus_dir / "analytics.json").write_text(json.dumps(legacy))
+        assert Analytics(manus_dir).average_quality() == 35
+        console.print("✅ Quality aggregate migration working")
+    
+    console.print("[bold green]✅ Analytics Persistence: ALL TESTS PASSED[/bold green]")
+
+
+def test_conversations():
+    """Test conversation history files."""
+    console.print("\n[bold cyan]Testing Conversation History...[/bold cyan]")
+    
+    from manus_cli.api_enhanced import ManusClient
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        class Client(ManusClient):
+            HISTORY_DIR = Path(tmpdir)
+        
+        client = Client(api_key="test-key")
+        messages = [
+            {"role": "user", "content": "Hello"},
+            {"role": "assistant", "content": "Hi there!"}
+        ]
+        
+        # Test 1: Save and load round trip
+        client.save_conversation("conv1", messages)
+        loaded = client.load_conversation("conv1")
+        assert loaded["id"] == "conv1"
+        assert loaded["messages"] == messages
+        assert Client(api_key="test-key").load_conversation("conv1")["messages"] == messages
+        console.print("✅ Save/load round trip working")
+        
+        # Test 2: Saving again keeps a single file per conversation
+        client.save_conversation("conv1", messages + [{"role": "user", "content": "More"}])
+        assert len(list(Path(tmpdir).glob("*__conv1.json"))) == 1
+        assert len(client.load_conversation("conv1")["messages"]) == 3
+        console.print("✅ Re-saving working")
+        
+        # Test 3: A save left behind by a crash loses to the newest one
+        stale = Path(tmpdir) / "1000__conv1.json"
+        stale.write_text(json.dumps({"id": "conv1", "messages": [], "timestamp": 1000}))
+        fresh = Client(api_key="test-key")
+        assert len(fresh.load_conversation("conv1")["messages"]) == 3
+        assert not stale.exists()
+        console.print("✅ Stale file cleanup working")
+        
+        # Test 4: Legacy '<id>.json' files still load and list
+        (Path(tmpdir) / "legacy.json").write_text(json.dumps({
+            "id": "legacy", "messages": messages, "timestamp": 500
+        }))
+        assert fresh.load_conversation("legacy")["messages"] == messages
+        
+        listed = {c["id"]: c for c in fresh.list_conversations()}
+        assert set(listed) == {"conv1", "legacy"}
+        assert listed["conv1"]["message_count"] == 3
+        assert listed["legacy"]["message_count"] == 2
+        assert fresh.load_conversation("missing") is None
+        console.print("✅ Listing and legacy files working")
+        
+        # Test 5: Concurrent writes to one path never collide
+        from manus_cli.fileutils import atomic_write
+        target = Path(tmpdir) / "shared.json"
+        payloads = [json.dumps({"writer": i, "pad": "x" * 65536}).encode() for i in range(8)]
+        errors = []
+        
+        def write(payload):
+            try:
+                for _ in range(20):
+                    atomic_write(target, payload, durable=False)
+            except OSError as e:
+                errors.append(e)
+        
+        writers = [threading.Thread(target=write, args=(payload,)) for payload in payloads]
+        for writer in writers:
+            writer.start()
+        for writer in writers:
+            writer.join()
+        assert not errors
+        assert target.read_bytes() in payloads
+        assert not list(Path(tmpdir).glob("shared.json.tmp.*"))
+        console.print("✅ Concurrent atomic writes working")
+    
+    console.print("[bold green]✅ Conversation History: ALL TESTS PASSED[/bold green]")
+
+
+class _TaskHandler(BaseHTTPRequestHandler):
+    """Serves task streams whose behaviour is picked by the prompt."""
+    protocol_version = "HTTP/1.1"
+    attempts = {}
+    
+    def log_message(self, *args):
+        pass
+    
+    def do_POST(self):
+        length = int(self.headers.get("content-length", 0))
+        prompt = json.loads(self.rfile.read(length))["prompt"]
+        attempt = self.attempts[prompt] = self.attempts.get(prompt, 0) + 1
+        
+        if prompt == "flaky" and attempt == 1:
+            self.send_response(503)
+            self.send_header("content-length", "0")
+            self.end_headers()
+            return
+        
+        self.send_response(200)
+        self.send_header("content-type", "text/event-stream")
+        self.send_header("connection", "close")
+        self.end_headers()
+        
+        if prompt in ("ok", "flaky"):
+            self.wfile.write(b'data: {"content": "Hel"}\n\ndata: {"content": "lo"}\n\ndata: [DONE]\n\n')
+        elif prompt == "failed":
+            self.wfile.write(b'data: {"content": "Par"}\n\ndata: {"status": "failed", "error": "boom"}\n\n')
+        elif prompt == "truncated":
+            self.wfile.write(b'data: {"content": "Par"}\n\n')
+        elif prompt == "slow":
+            for _ in range(10):
+                self.wfile.write(b'data: {"content": "."}\n\n')
+                self.wfile.flush()
+                time.sleep(0.3)
+            self.wfile.write(b'data: [DONE]\n\n')
+        self.wfile.flush()
+        self.close_connection = True
+
+
+def test_chat_errors():
+    """Test ManusClient.chat() error paths."""
+    console.print("\n[bold cyan]Testing Chat Error Handling...[/bold cyan]")
+    
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _TaskHandler)
+    server.daemon_threads = True
+    server.handle_error = lambda request, client_address: None
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    
+    try:
+        from manus_cli.api_enhanced import ManusClient, ManusAPIError
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            class Client(ManusClient):
+                API_URL = f"http://127.0.0.1:{server.server_port}/v1/tasks"
+                HISTORY_DIR = Path(tmpdir)
+            
+            client = Client(api_key="test-key")
+            
+            # Test 1: Successful stream
+            assert client.chat("ok") == "Hello"
+            console.print("✅ Streamed response working")
+            
+            # Test 2: Task creation is retried
+            assert client.chat("flaky") == "Hello"
+            assert _TaskHandler.attempts["flaky"] == 2
+            console.print("✅ Retry on server error working")
+            
+            # Test 3: A failed task raises instead of returning partial text
+            try:
+                client.chat("failed")
+                assert False, "failed task did not raise"
+            except ManusAPIError as e:
+                assert "boom" in str(e)
+            console.print("✅ Failed task detection working")
+            
+            # Test 4: A stream cut off before [DONE] raises in chat() only
+            try:
+                client.chat("truncated")
+                assert False, "truncated stream did not raise"
+            except ManusAPIError:
+                pass
+            assert "".join(client.stream_task("truncated")) == "Par"
+            console.print("✅ Truncated stream detection working")
+            
+            # Test 5: max_wait bounds the call even while chunks keep arriving
+            start = time.monotonic()
+            try:
+                client.chat("slow", max_wait=1)
+                assert False, "slow task did not time out"
+            except ManusAPIError as e:
+                assert "timed out" in str(e)
+            assert time.monotonic() - start < 2
+            # The worker reading the stream is stopped, not left running
+            time.sleep(0.2)
+            assert not [t for t in threading.enumerate() if "consume" in t.name]
+            console.print("✅ Deadline enforcement working")
+            
+            client.close()
+        
+        console.print("[bold green]✅ Chat Error Handling: ALL TESTS PASSED[/bold green]")
+    
+    finally:
+        server.shutdown()
+
+
+def _run(name, test):
+    """Run one test function, reporting a failure instead of raising it."""
+    try:
+        test()
+        return True
+    except Exception as e:
+        console.print(f"[bold red]❌ {name}: FAILED[/bold red]")
+        console.print(f"Error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """Run all persistence tests."""
+    console.print(Panel.fit(
+        "[bold cyan]Manus CLI Persistence Tests[/bold cyan]\n"
+        "Testing: Analytics, Conversation History, Chat Error Handling",
+        border_style="cyan"
+    ))
+    
+    results = {
+        "Analytics Persistence": _run("Analytics Persistence", test_analytics),
+        "Conversation History": _run("Conversation History", test_conversations),
+        "Chat Error Handling": _run("Chat Error Handling", test_chat_errors)
+    }
+    
+    # Summary
+    console.print("\n" + "="*60)
+    console.print("[bold]Test Summary:[/bold]\n")
+    
+    passed = sum(1 for r in results.values() if r)
+    total = len(results)
+    
+    for name, result in results.items():
+        status = "[green]✅ PASS[/green]" if result else "[red]❌ FAIL[/red]"
+        console.print(f"  {name}: {status}")
+    
+    console.print(f"\n[bold]Total: {passed}/{total} tests passed[/bold]")
+    
+    if passed == total:
+        console.print("\n[bold green]🎉 ALL PERSISTENCE FEATURES WORKING CORRECTLY![/bold green]")
+        return 0
+    else:
+        console.print("\n[bold red]⚠️  SOME TESTS FAILED - NEEDS FIXING[/bold red]")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
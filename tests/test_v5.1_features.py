@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 Comprehensive test script for Manus CLI v5.1 features
-Tests: Extended Thinking, Effort, Templates, Validation
+Tests: Extended Thinking, Effort, Templates, Validation, Chain of Thought
 """
 
 import sys
@@ -103,7 +103,13 @@ def test_effort():
         assert "max_tokens" in config
         assert "temperature" in config
         assert "thinking_budget" in config
-        console.print(f"  Medium config: {config}")
+        console.print(f"  Medium config: {dict(config)}")
+        try:
+            config["max_tokens"] = 1
+            assert False, "shared config was modified"
+        except TypeError:
+            pass
+        assert EffortManager(EffortLevel.MEDIUM).get_config()["max_tokens"] == 2000
         console.print("✅ Config retrieval working")
         
         # Test 3: Apply to request
@@ -234,11 +240,53 @@ def test_validation():
         return False
 
 
+def test_cot():
+    """Test Chain of Thought heuristics."""
+    console.print("\n[bold cyan]Testing Chain of Thought...[/bold cyan]")
+    
+    try:
+        from manus_cli.cot import ChainOfThought
+        
+        cot = ChainOfThought(enabled=True)
+        
+        # Test 1: analyze() agrees with the separate heuristics
+        inputs = [
+            ("chat", "What is Python?"),
+            ("chat", "Why? How? When?"),
+            ("chat", "Write the requirements for a login page"),
+            ("plan", "Add a cache"),
+            ("chat", " ".join(["word"] * 60)),
+            ("chat", " ".join(["word"] * 120) + " ? ? ?"),
+        ]
+        for command, user_input in inputs:
+            expected = (cot.should_enable_cot(command, user_input), cot.assess_complexity(user_input))
+            assert ChainOfThought().analyze(command, user_input) == expected
+            assert cot.analyze(command, user_input) == expected
+        console.print("✅ Combined analysis working")
+        
+        # Test 2: Prompt wrapping
+        wrapped = cot.wrap_prompt("Design a system", task_complexity="complex")
+        assert "<thinking>" in wrapped
+        assert "User Request: Design a system" in wrapped
+        assert ChainOfThought(enabled=False).wrap_prompt("Design a system") == "Design a system"
+        console.print("✅ Prompt wrapping working")
+        
+        console.print("[bold green]✅ Chain of Thought: ALL TESTS PASSED[/bold green]")
+        return True
+        
+    except Exception as e:
+        console.print(f"[bold red]❌ Chain of Thought: FAILED[/bold red]")
+        console.print(f"Error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def main():
     """Run all v5.1 tests."""
     console.print(Panel.fit(
         "[bold cyan]Manus CLI v5.1 Feature Tests[/bold cyan]\n"
-        "Testing: Extended Thinking, Effort, Templates, Validation",
+        "Testing: Extended Thinking, Effort, Templates, Validation, Chain of Thought",
         border_style="cyan"
     ))
     
@@ -246,7 +294,8 @@ def main():
         "Extended Thinking": test_extended_thinking(),
         "Effort Parameter": test_effort(),
         "Prompt Templates": test_templates(),
-        "Output Validation": test_validation()
+        "Output Validation": test_validation(),
+        "Chain of Thought": test_cot()
     }
     
     # Summary